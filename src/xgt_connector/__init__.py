@@ -21,6 +21,7 @@ __ALL__ = [
   'Neo4jDriver',
   'ODBCConnector',
   'SQLODBCDriver',
+  'ADBCDriver',
 ]
 
 from .neo4j_connector import Neo4jConnector, Neo4jDriver
@@ -32,5 +33,6 @@ try:
     from .odbc import OracleODBCDriver
     from .odbc import SAPODBCDriver
     from .odbc import SnowflakeODBCDriver
+    from .odbc import ADBCDriver
 except ImportError:
     pass
@@ -17,6 +17,9 @@
 #
 #===----------------------------------------------------------------------===#
 
+import json
+import os
+import threading
 import time
 import datetime
 import pyarrow.flight as pf
@@ -34,7 +37,7 @@ class BasicArrowClientAuthHandler(pf.ClientAuthHandler):
         return self.token
 
 class ProgressDisplay():
-    def __init__(self, total_count, bar_size = 60, prefix = "Transferring: "):
+    def __init__(self, total_count, bar_size = 60, prefix = "Transferring: ", wait_time = None):
         self._bar_end = '\r'
         # When drawing the bar, we can only use 1 line so we need to shrink
         # the bar elements for cases where the terminal is too tiny.
@@ -59,7 +62,11 @@ class ProgressDisplay():
         self._count = 0
         self._bar_size = bar_size
         self._prefix = prefix
+        # Function returning the seconds spent waiting on throttling.
+        self._wait_time = wait_time
         self._start_time = time.time()
+        # Transfers may report progress from several threads.
+        self._lock = threading.Lock()
 
     def __enter__(self):
         self.show_progress()
@@ -73,12 +80,19 @@ class ProgressDisplay():
         return f'{datetime.timedelta(seconds=isec)}.{fsec:0{digits}.0f}'
 
     def show_progress(self, count_to_add = 0):
+        with self._lock:
+            self.__show_progress(count_to_add)
+
+    def __show_progress(self, count_to_add):
         self._count += count_to_add
         current_elapsed = time.time() - self._start_time
         rate = 0 if self._count == 0 else round(self._count / (current_elapsed), 1)
         duration = self.__format_time(current_elapsed)
+        throttled = ""
+        if self._wait_time is not None and self._wait_time() > 0:
+            throttled = ", throttled: {}s".format(self.__format_time(self._wait_time()))
         if self._total_count == 0:
-            print("{}{} in {}s ({}/s)     ".format(self._prefix, self._count, duration, rate), end=self._bar_end, flush=True)
+            print("{}{} in {}s ({}/s{})     ".format(self._prefix, self._count, duration, rate, throttled), end=self._bar_end, flush=True)
             return
         # Counts are no longer accurate
         while (self._count > self._total_count):
@@ -87,7 +101,39 @@ class ProgressDisplay():
         remaining = 0 if self._count == 0 else ((self._total_count - self._count) *
                                                (current_elapsed)) / self._count
         remaining = self.__format_time(remaining)
-        print("{}[{}{}] {}/{} in {}s ({}/s, eta: {}s)     ".format(self._prefix,
+        print("{}[{}{}] {}/{} in {}s ({}/s, eta: {}s{})     ".format(self._prefix,
               u"#"*progress, "."*(self._bar_size-progress), self._count,
-              self._total_count, duration, rate, remaining), end=self._bar_end, flush=True)
+              self._total_count, duration, rate, remaining, throttled), end=self._bar_end, flush=True)
+
+
+class _JSONState():
+    # A dictionary kept in a JSON file, such as transfer checkpoints.
+    # Every change is written out right away through a temporary file so the
+    # file is never left half written.
+    def __init__(self, path):
+        self._path = path
+        self._lock = threading.Lock()
+        self._state = { }
+        if os.path.exists(path):
+            with open(path) as state_file:
+                self._state = json.load(state_file)
+
+    def get(self, key, default = None):
+        with self._lock:
+            return self._state.get(key, default)
+
+    def set(self, key, value):
+        with self._lock:
+            self._state[key] = value
+            self.__save()
+
+    def remove(self, key):
+        with self._lock:
+            if self._state.pop(key, None) is not None:
+                self.__save()
 
+    def __save(self):
+        temp_path = self._path + '.tmp'
+        with open(temp_path, 'w') as state_file:
+            json.dump(self._state, state_file, indent = 2)
+        os.replace(temp_path, self._path)
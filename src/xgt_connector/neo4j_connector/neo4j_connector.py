@@ -17,21 +17,342 @@
 #
 #===----------------------------------------------------------------------===#
 
+import array
+import asyncio
+import bisect
 import datetime
+import itertools
+import multiprocessing
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.flight as pf
 
 import neo4j
 import xgt
 import os
+import queue
+import threading
 import time
+import traceback
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from ..common import ProgressDisplay
 from ..common import BasicArrowClientAuthHandler
+from ..common import _JSONState
 
 from .query_translator import QueryTranslator
 
+_BOLT_BLOCK_SIZE = 10000
+
+_NEO4J_TEMPORAL_TYPES = ('Date', 'Time', 'DateTime', 'LocalTime',
+                         'LocalDateTime')
+
+_NEO4J_TEMPORAL_ARRAY_TYPES = ('DateArray', 'TimeArray', 'DateTimeArray',
+                               'LocalTimeArray', 'LocalDateTimeArray')
+
+def _arrow_schema(neo4j_schema):
+    schema = pa.schema([])
+    for i, value in enumerate(neo4j_schema):
+        arrow_type = Neo4jConnector._NEO4J_TYPE_TO_ARROW_TYPE[value[1]]
+        schema = schema.append(pa.field('col' + str(i), arrow_type))
+    return schema
+
+def _fetch_records(result, count):
+    # Result.fetch is only available with newer drivers.
+    if hasattr(result, 'fetch'):
+        return result.fetch(count)
+    return list(itertools.islice(result, count))
+
+async def _async_record_blocks(result):
+    # Blocks of up to _BOLT_BLOCK_SIZE records read from an async result.
+    if hasattr(result, 'fetch'):
+        while True:
+            records = await result.fetch(_BOLT_BLOCK_SIZE)
+            if len(records) == 0:
+                return
+            yield records
+    records = []
+    async for record in result:
+        records.append(record)
+        if len(records) == _BOLT_BLOCK_SIZE:
+            yield records
+            records = []
+    if len(records) > 0:
+        yield records
+
+def _bolt_column_converter(neo4j_type):
+    def convert_duration(val):
+        # For months this average seconds in a month.
+        return (val.months * 2628288 + val.days * 86400 +
+                val.seconds) * 10**9 + val.nanoseconds
+    if neo4j_type in _NEO4J_TEMPORAL_TYPES:
+        return lambda column: [None if x is None else x.to_native()
+                               for x in column]
+    elif neo4j_type in _NEO4J_TEMPORAL_ARRAY_TYPES:
+        return lambda column: [None if x is None else
+                               [y.to_native() for y in x] for x in column]
+    elif neo4j_type == 'Duration':
+        return lambda column: [None if x is None else convert_duration(x)
+                               for x in column]
+    elif neo4j_type == 'DurationArray':
+        return lambda column: [None if x is None else
+                               [convert_duration(y) for y in x]
+                               for x in column]
+    return None
+
+def _bolt_converters(neo4j_schema):
+    # Converters are chosen once per column, so only columns holding
+    # temporal or duration values pay for a conversion.
+    return [_bolt_column_converter(value[1]) for value in neo4j_schema]
+
+def _bolt_batch(records, converters, schema):
+    # Any columns past the schema, such as paging ids, are left out.
+    columns = []
+    for i, column in enumerate(itertools.islice(zip(*records), len(schema))):
+        if converters[i] is not None:
+            column = converters[i](column)
+        columns.append(pa.array(column, type=schema.field(i).type))
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+def _bolt_batches(result, neo4j_schema, schema):
+    converters = _bolt_converters(neo4j_schema)
+    while True:
+        records = _fetch_records(result, _BOLT_BLOCK_SIZE)
+        if len(records) == 0:
+            return
+        yield _bolt_batch(records, converters, schema)
+
+def _neo4j_value_type(value):
+    # The type name the Neo4j schema procedures give a property value.
+    # Duration and Point are tuples, so they are checked before lists.
+    if isinstance(value, neo4j.time.Duration):
+        return 'Duration'
+    elif isinstance(value, neo4j.spatial.Point):
+        return 'Point'
+    elif isinstance(value, (list, tuple)):
+        if len(value) == 0:
+            return 'StringArray'
+        return _neo4j_value_type(value[0]) + 'Array'
+    elif isinstance(value, bool):
+        return 'Boolean'
+    elif isinstance(value, int):
+        return 'Long'
+    elif isinstance(value, float):
+        return 'Double'
+    elif isinstance(value, str):
+        return 'String'
+    elif isinstance(value, neo4j.time.DateTime):
+        return 'LocalDateTime' if value.tzinfo is None else 'DateTime'
+    elif isinstance(value, neo4j.time.Date):
+        return 'Date'
+    elif isinstance(value, neo4j.time.Time):
+        return 'LocalTime' if value.tzinfo is None else 'Time'
+    elif isinstance(value, (bytes, bytearray)):
+        return 'ByteArray'
+    return type(value).__name__
+
+# Cypher functions turning a saved watermark back into its temporal type.
+_WATERMARK_FUNCTIONS = {'Date' : 'date', 'Time' : 'time',
+                        'DateTime' : 'datetime', 'LocalTime' : 'localtime',
+                        'LocalDateTime' : 'localdatetime'}
+
+def _watermark_state(value):
+    # A watermark as it is saved in the state file.
+    neo4j_type = _neo4j_value_type(value)
+    if neo4j_type in _WATERMARK_FUNCTIONS:
+        value = value.iso_format()
+    return {'type' : neo4j_type, 'value' : value}
+
+def _neo4j_sampled_properties(samples):
+    # Groups sampled (labels, properties) pairs by their labels into records
+    # like the ones from db.schema.nodeTypeProperties.
+    groups = { }
+    for labels, properties in samples:
+        group = groups.setdefault(tuple(labels), [0, { }])
+        group[0] += 1
+        for name, value in properties.items():
+            seen = group[1].setdefault(name, [set(), 0])
+            seen[0].add(_neo4j_value_type(value))
+            seen[1] += 1
+    records = []
+    for labels, (count, properties) in groups.items():
+        node_type = ''.join(f":`{label}`" for label in labels)
+        if len(properties) == 0:
+            records.append((node_type, list(labels), None, None, False))
+        for name, (types, present) in properties.items():
+            records.append((node_type, list(labels), name, sorted(types),
+                            present == count))
+    return records
+
+def _copy_partition(settings, query, parameters, neo4j_schema, batches):
+    # Runs in a worker process extracting one id range of a label or
+    # relationship type. Batches are sent back to the parent serialized.
+    try:
+        driver = neo4j.GraphDatabase.driver(settings['uri'],
+                                            auth=settings['auth'])
+        try:
+            with driver.session(database=settings['database'],
+                                default_access_mode=neo4j.READ_ACCESS,
+                                fetch_size=_BOLT_BLOCK_SIZE) as session:
+                schema = _arrow_schema(neo4j_schema)
+                result = session.run(query, parameters)
+                for batch in _bolt_batches(result, neo4j_schema, schema):
+                    batches.put(('batch', batch.serialize().to_pybytes()))
+        finally:
+            driver.close()
+        batches.put(('done', None))
+    except Exception:
+        batches.put(('error', traceback.format_exc()))
+
+class _Extraction(object):
+    # The query extracting one vertex or edge frame from Neo4j.
+    # It is kept in parts so conditions, such as id ranges, can be added.
+    # An extraction read once for several frames has a route for each,
+    # (frame, neo4j_schema, columns, labels), picking the frame's columns
+    # and the rows whose label columns hold the labels.
+    def __init__(self, name, frame, neo4j_schema, match, conditions, returns,
+                 id_variable, endpoints = (), routes = ()):
+        self.name = name
+        self.frame = frame
+        self.neo4j_schema = neo4j_schema
+        self.match = match
+        self.conditions = conditions
+        self.returns = returns
+        self.id_variable = id_variable
+        self.endpoints = endpoints
+        self.routes = routes
+
+    def query(self, conditions = (), returns = None):
+        conditions = list(self.conditions) + list(conditions)
+        query = self.match
+        if len(conditions) > 0:
+            query += " WHERE " + " AND ".join(conditions)
+        return query + " RETURN " + (self.returns if returns is None else returns)
+
+class _IdSet(object):
+    # Neo4j ids kept sorted in a typed array, 8 bytes an id, for the large
+    # sets of reached nodes and relationships of a subgraph transfer.
+    def __init__(self, ids = ()):
+        self._ids = array.array('q', sorted(set(ids)))
+
+    def __contains__(self, neo4j_id):
+        i = bisect.bisect_left(self._ids, neo4j_id)
+        return i < len(self._ids) and self._ids[i] == neo4j_id
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def update(self, ids):
+        # Adds ids, which are expected to be new, with one sort per update.
+        self._ids = array.array('q', sorted(itertools.chain(self._ids, ids)))
+
+    def batches(self, size):
+        for i in range(0, len(self._ids), size):
+            yield self._ids[i:i + size].tolist()
+
+def _label_mask(labels, label):
+    # The rows whose list of labels contains label, or is empty for None.
+    if label is None:
+        return pc.equal(pc.list_value_length(labels), 0)
+    rows = pc.filter(pc.list_parent_indices(labels),
+                     pc.equal(pc.list_flatten(labels), label))
+    return pc.is_in(pa.array(range(len(labels)), pa.int64()),
+                    value_set = rows.cast(pa.int64()))
+
+class _RoutedWriter(object):
+    # Writes the batches of an extraction read once for several frames to
+    # the writer of each frame, selecting its columns and rows per batch.
+    def __init__(self, routes, writers):
+        self.routes = routes
+        self.writers = writers
+        self.schemas = [_arrow_schema(route[1]) for route in routes]
+
+    def write(self, batch):
+        label_columns = len(self.routes[0][3])
+        labels = batch.columns[batch.num_columns - label_columns:]
+        for (_, _, columns, route_labels), writer, schema in zip(
+                self.routes, self.writers, self.schemas):
+            mask = None
+            for column, label in zip(labels, route_labels):
+                selected = _label_mask(column, label)
+                mask = selected if mask is None else pc.and_(mask, selected)
+            routed = pa.RecordBatch.from_arrays(
+                [batch.column(i) for i in columns], schema = schema).filter(mask)
+            if routed.num_rows > 0:
+                writer.write(routed)
+
+    def close(self):
+        for writer in self.writers:
+            writer.close()
+
+class _TeeWriter(object):
+    # Writes each batch to all of its writers.
+    def __init__(self, writers):
+        self.writers = writers
+
+    def write(self, batch):
+        for writer in self.writers:
+            writer.write(batch)
+
+    def close(self):
+        for writer in self.writers:
+            writer.close()
+
+class _SchemaSnapshot(object):
+    # The schema discovered from a Neo4j database along with the fingerprint
+    # of the database when it was discovered. The fingerprint holds the label
+    # and relationship type counts and the property keys, which are cheap to
+    # read from the count store, and is used to tell when to rediscover.
+    def __init__(self, node_type_properties, rel_type_properties, edges,
+                 fingerprint, created = None, confidence = None):
+        self.node_type_properties = node_type_properties
+        self.rel_type_properties = rel_type_properties
+        self.edges = edges
+        self.fingerprint = fingerprint
+        self.confidence = ({'nodes' : { }, 'edges' : { }}
+                           if confidence is None else confidence)
+        self.created = time.time() if created is None else created
+
+    def to_dict(self):
+        def encode(label):
+            # Nodes with several labels are kept as a set of labels.
+            return sorted(label) if isinstance(label, frozenset) else label
+        edges = { }
+        for name, edge in self.edges.items():
+            edges[name] = {
+                'schema' : edge['schema'],
+                'endpoints' : [[encode(source), encode(target)]
+                               for source, target in edge['endpoints']],
+                'sources' : [encode(label) for label in edge['sources']],
+                'targets' : [encode(label) for label in edge['targets']],
+            }
+        return {'node_type_properties' : self.node_type_properties,
+                'rel_type_properties' : self.rel_type_properties,
+                'edges' : edges, 'fingerprint' : self.fingerprint,
+                'created' : self.created, 'confidence' : self.confidence}
+
+    @classmethod
+    def from_dict(cls, values):
+        def decode(label):
+            return frozenset(label) if isinstance(label, list) else label
+        edges = { }
+        for name, edge in values['edges'].items():
+            edges[name] = {
+                'schema' : edge['schema'],
+                'endpoints' : {(decode(source), decode(target))
+                               for source, target in edge['endpoints']},
+                'sources' : {decode(label) for label in edge['sources']},
+                'targets' : {decode(label) for label in edge['targets']},
+            }
+        return cls(values['node_type_properties'],
+                   values['rel_type_properties'], edges,
+                   values['fingerprint'], values['created'],
+                   values.get('confidence'))
+
 class Neo4jDriver(object):
     def __init__(self, host = 'localhost',
                        bolt_port = 7687, http_port = 7474,
@@ -40,7 +361,11 @@ class Neo4jDriver(object):
                        driver = 'neo4j-bolt',
                        protocol = 'neo4j',
                        http_protocol = 'http',
-                       verbose = False):
+                       verbose = False,
+                       max_workers = 1,
+                       max_connection_pool_size = None,
+                       connection_acquisition_timeout = None,
+                       prefetch_batches = 0):
         """
         Initializes the driver class.
 
@@ -75,7 +400,28 @@ class Neo4jDriver(object):
             Acceptable values include: http, https, http+s, http+ssc.
         verbose : bool
             Print detailed information during calls.
+        max_workers : int
+            Number of labels or relationship types extracted from Neo4j at
+            the same time, each over its own session.
+            By default 1.
+        max_connection_pool_size : int
+            Maximum number of connections in the bolt driver's connection pool.
+            Should be at least max_workers.
+            If None, uses the bolt driver's default.
+            Ignored when a bolt driver is passed in.
+        connection_acquisition_timeout : float
+            Seconds to wait for a connection from the bolt driver's pool.
+            If None, uses the bolt driver's default.
+            Ignored when a bolt driver is passed in.
+        prefetch_batches : int
+            Number of batches read and converted ahead of the batch being
+            written to xGT.
+            If positive, records are read on a separate thread so reading from
+            Neo4j overlaps with writing to xGT.
+            By default 0, reading and writing on the same thread.
         """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, not {max_workers}.")
         if not isinstance(host, (neo4j.Neo4jDriver, neo4j.BoltDriver)):
             self._host = host
             self._bolt_port = bolt_port
@@ -86,11 +432,17 @@ class Neo4jDriver(object):
             self._http_protocol = http_protocol
             # neo4j arrow can't take none as a parameter for the database.
             self._database_arrow = 'neo4j' if database == None else database
+            # Used by worker processes to open their own bolt drivers.
+            self._bolt_settings = {'uri' : f"{protocol}://{host}",
+                                   'auth' : auth, 'database' : database}
             driver_passed_in = False
         else:
+            self._bolt_settings = None
             driver_passed_in = True
 
         self._database = database
+        self._max_workers = max_workers
+        self._prefetch_batches = prefetch_batches
         self.__verbose = verbose
 
         # These are just kept as seperate variables because they may be needed
@@ -101,11 +453,18 @@ class Neo4jDriver(object):
         if self.__verbose:
             print('Using ' + driver + ' for transfers of data.')
 
+        self._pool_config = { }
+        if max_connection_pool_size is not None:
+            self._pool_config['max_connection_pool_size'] = max_connection_pool_size
+        if connection_acquisition_timeout is not None:
+            self._pool_config['connection_acquisition_timeout'] = connection_acquisition_timeout
+
         if driver_passed_in:
             self._neo4j_driver = host
         else:
             self._neo4j_driver = neo4j.GraphDatabase.driver(f"{self._protocol}://{self._host}",
-                                                            auth=self._auth)
+                                                            auth=self._auth,
+                                                            **self._pool_config)
         if driver == 'neo4j-bolt':
             pass
         elif driver == 'py2neo-bolt':
@@ -130,8 +489,11 @@ class Neo4jDriver(object):
 
     @classmethod
     def from_Neo4jDriver(self, neo4j_driver,
-                         database = neo4j.DEFAULT_DATABASE):
-        return Neo4jDriver(neo4j_driver, database = database)
+                         database = neo4j.DEFAULT_DATABASE,
+                         max_workers = 1, prefetch_batches = 0):
+        return Neo4jDriver(neo4j_driver, database = database,
+                           max_workers = max_workers,
+                           prefetch_batches = prefetch_batches)
 
     @property
     def bolt(self) -> neo4j.Neo4jDriver:
@@ -145,6 +507,16 @@ class Neo4jDriver(object):
         """
         return self._neo4j_driver
 
+    def _async_bolt(self):
+        # An async bolt driver with the same settings, used by the async
+        # transfers. It is bound to the event loop that uses it, so one is
+        # created for each transfer and closed by it.
+        if self._bolt_settings is None:
+            raise ValueError("Async transfers require a Neo4jDriver created from a host.")
+        return neo4j.AsyncGraphDatabase.driver(self._bolt_settings['uri'],
+                                               auth=self._bolt_settings['auth'],
+                                               **self._pool_config)
+
     def query(self, query, write=True, use_neo4j_always=False):
         """
         Runs the query on Neo4j as returns the results.
@@ -194,6 +566,7 @@ class Neo4jDriver(object):
             self._query = query
             self._connector = connector
             self._closed = False
+            self._result = None
             if write:
                 self._session = self._connector._neo4j_driver.session(database=self._connector._database,
                                                                       default_access_mode=neo4j.WRITE_ACCESS)
@@ -207,14 +580,17 @@ class Neo4jDriver(object):
             self.finalize()
 
         def result(self):
-            return self._session.run(self._query)
+            # Run the query once so finalizing doesn't run it again.
+            if self._result is None:
+                self._result = self._session.run(self._query)
+            return self._result
 
         def finalize(self):
             for result in self.result():
                 pass
             if not self._closed:
                 self._session.close()
-                self._close = True
+                self._closed = True
 
 class Neo4jConnector(object):
     _NEO4J_TYPE_TO_XGT_TYPE = {
@@ -273,6 +649,8 @@ class Neo4jConnector(object):
         'PointArray': pa.list_(pa.list_(pa.float32())),
     }
 
+    _DEFAULT_PAGE_SIZE = 100000
+
     class _Labels(Enum):
         HAS_BOTH = 0,
         BOTH_EMPTY = 1,
@@ -293,7 +671,10 @@ class Neo4jConnector(object):
     def __init__(self, xgt_server,
                        neo4j_driver,
                        verbose = False,
-                       enable_apoc = True):
+                       enable_apoc = True,
+                       schema_ttl = 0,
+                       schema_cache = None,
+                       schema_sample = None):
         """
         Initializes the connector class.
 
@@ -309,6 +690,25 @@ class Neo4jConnector(object):
             If the connector finds APOC, it will use that to improve schema queries.
             If set to True this enables that feature.
             By default this is True.
+        schema_ttl : float
+            Seconds the discovered Neo4j schema is reused for.
+            While reused, the schema is only discovered again when the counts
+            of labels and relationship types or the property keys change.
+            If None, the schema is reused until those change.
+            By default 0, discovering the schema every time it is used.
+        schema_cache : str
+            Path of a file to save the discovered Neo4j schema to, and load it
+            from when the connector is created.
+            Only used when schema_ttl is not 0.
+            By default None.
+        schema_sample : int
+            Number of nodes of each label and relationships of each type
+            looked at when discovering the schema.
+            With APOC, this is passed to the APOC schema procedures.
+            Properties whose types were only seen in the sample are listed
+            in neo4j_schema_confidence.
+            If None, all nodes and relationships are looked at.
+            By default None.
         """
 
         self._xgt_server = xgt_server
@@ -332,6 +732,23 @@ class Neo4jConnector(object):
         self._neo4j_rel_type_properties = None
         self._neo4j_property_keys = None
         self._neo4j_node_labels = None
+        self._neo4j_counts = { }
+        self._neo4j_schema_confidence = {'nodes' : { }, 'edges' : { }}
+
+        if schema_sample is not None and schema_sample < 1:
+            raise ValueError("schema_sample must be at least 1.")
+        self._schema_sample = schema_sample
+
+        self._schema_ttl = schema_ttl
+        self._schema_cache = None
+        self._schema_snapshot = None
+        self._schema_applied = None
+        self._schema_refreshing = False
+        if schema_ttl != 0 and schema_cache is not None:
+            self._schema_cache = _JSONState(schema_cache)
+            snapshot = self._schema_cache.get(self.__schema_cache_key())
+            if snapshot is not None:
+                self._schema_snapshot = _SchemaSnapshot.from_dict(snapshot)
 
     def __str__(self) -> str:
         result = ""
@@ -455,6 +872,29 @@ class Neo4jConnector(object):
         """
         return self.__neo4j_edges()
 
+    @property
+    def neo4j_schema_confidence(self) -> dict():
+        """
+        Retrieve the confidence in the property types inferred from a sample
+        when schema_sample is set.
+
+        The dictionary has the keys 'nodes' and 'edges', mapping node labels
+        and relationship types to a dictionary of the property names whose
+        types were only seen in the sample.
+        Each of these is mapped to the fraction of the nodes or relationships
+        that were looked at, or None if the number of nodes isn't known.
+        Properties of labels and types that were looked at completely aren't
+        listed.
+
+        Returns
+        -------
+        dict
+          Dictionary mapping 'nodes' and 'edges' to the confidence in their
+          property types.
+        """
+        self.__update_cache_state()
+        return self._neo4j_schema_confidence
+
     def get_xgt_schemas(self, vertices = None, edges = None,
                         neo4j_id_name = 'neo4j_id',
                         neo4j_source_node_name = 'neo4j_source',
@@ -471,10 +911,17 @@ class Neo4jConnector(object):
             List of requested node labels (vertex frame names) as a string or tuple.
             To map to a specific from a Neo4j label to a xGT frame use a tuple like so:
             ('neo4j_name', 'xgt_name').
+            The tuple may also give a list of the properties to transfer
+            and a Cypher predicate on the node v selecting the nodes to
+            transfer: ('neo4j_name', 'xgt_name', ['a', 'b'], 'v.active').
+            Either may be None to transfer all of them.
         edges : iterable
             List of requested relationship type (edge frame) names or tuple.
             To map to a specific from a Neo4j type to a xGT frame use a tuple like so:
             ('neo4j_name', 'xgt_name').
+            The tuple may also give a list of the properties to transfer
+            and a Cypher predicate on the relationship e and its source and
+            target nodes u and v: ('neo4j_name', 'xgt_name', ['a'], 'e.weight > 1').
             Any vertices not given for an edge will be automatically requested unless disabled.
         neo4j_id_name : str
             The name of the xGT column holding the Neo4j node's ID value.
@@ -506,6 +953,8 @@ class Neo4jConnector(object):
 
         mapping_vertices = { }
         mapping_edges = { }
+        # The properties and predicate given for a label or type.
+        filters = {'vertices' : { }, 'edges' : { }}
         for val in vertices:
             if isinstance(val, str):
                 if val != '':
@@ -514,25 +963,34 @@ class Neo4jConnector(object):
                     mapping_vertices[val] = self.__xgt_unlabeled_vertex_name()
             elif isinstance(val, tuple):
                 mapping_vertices[val[0]] = val[1]
+                filters['vertices'][val[0]] = self.__mapping_filter(val)
 
         for val in edges:
             if isinstance(val, str):
                 mapping_edges[val] = val
             elif isinstance(val, tuple):
                 mapping_edges[val[0]] = val[1]
+                filters['edges'][val[0]] = self.__mapping_filter(val)
 
         # Any vertices not given for an edge will be added to vertices.
         for edge in mapping_edges:
             if edge not in self.__neo4j_relationship_types(False):
                 raise ValueError(f"Neo4j Relationship {edge} is not found.")
+            properties, where = filters['edges'].get(edge, (None, None))
             schemas = self.__extract_xgt_edge_schemas(edge, mapping_vertices, mapping_edges,
-                neo4j_source_node_name, neo4j_target_node_name, import_edge_nodes, False)
+                neo4j_source_node_name, neo4j_target_node_name, import_edge_nodes, False,
+                properties)
+            for schema in schemas:
+                schema['where'] = where
             result['edges'][edge] = schemas
 
         for vertex in mapping_vertices:
             if vertex != self.__neo4j_unlabeled_vertex_name() and vertex not in self.__neo4j_node_labels(False):
                 raise ValueError(f"Neo4j Node Label {vertex} is not found.")
-            table_schema = self.__extract_xgt_vertex_schema(vertex, neo4j_id_name, mapping_vertices[vertex], False)
+            properties, where = filters['vertices'].get(vertex, (None, None))
+            table_schema = self.__extract_xgt_vertex_schema(vertex, neo4j_id_name, mapping_vertices[vertex], False,
+                                                            properties)
+            table_schema['where'] = where
             result['vertices'][vertex] = table_schema
             if self.__verbose:
                 print(f"xGT graph schema for vertex {vertex}: {table_schema}")
@@ -632,7 +1090,11 @@ class Neo4jConnector(object):
 
         return None
 
-    def copy_data_to_xgt(self, xgt_schemas) -> None:
+    def copy_data_to_xgt(self, xgt_schemas, partitions = 1, page_size = None,
+                         checkpoint = None, resume = False,
+                         single_pass = False, explain = False,
+                         watermark = None, watermark_state = None,
+                         watermark_insert_only = False):
         """
         Copies data from Neo4j to the requested vertex and/or edge frames
         in Rocketgraph xGT.
@@ -647,99 +1109,150 @@ class Neo4jConnector(object):
             to create in xGT.
             This dictionary can be the value returned from the
             :py:meth:`~Neo4jConnector.get_xgt_schemas` method.
+        partitions : int or dict
+            Number of Neo4j id ranges to split the extraction of a label or
+            relationship type into.
+            Each range is extracted by its own worker process.
+            A dictionary maps Neo4j labels and relationship types to their
+            number of ranges, with unlisted ones extracted in one piece.
+            Requires the neo4j-bolt driver with a Neo4jDriver created from a
+            host so the workers can connect.
+            By default 1.
+        page_size : int
+            If set, each label and relationship type is extracted in pages of
+            this many rows ordered by Neo4j id, each page read in its own
+            short transaction and committed to xGT before the next.
+            Requires the neo4j-bolt driver.
+            By default None, extracting each with a single query.
+        checkpoint : str
+            Path of a file recording the last Neo4j id committed to xGT for
+            each frame.
+            Implies paging, with pages of 100000 rows unless page_size is set.
+        resume : bool
+            If true, continue each frame after the last id recorded in the
+            checkpoint, skipping frames that were completed.
+            By default False, starting every frame from the beginning.
+        single_pass : bool
+            If true, a relationship type connecting several pairs of labels
+            is read with one query and its rows are sent to the frame of
+            their endpoint labels, instead of reading it once per pair.
+            Likewise labels sharing nodes are read with one query and each
+            node is sent to the frame of each of its labels.
+            Labels and types split into partitions are still read apart.
+            Requires the neo4j-bolt driver and cannot be combined with
+            paging.
+            By default False.
+        explain : bool or str
+            If true, run EXPLAIN on each extraction query before the copy
+            starts, printing the estimated rows and the operators of its
+            plan.
+            If 'profile', run PROFILE instead, which also reports the rows
+            and db hits but reads the data one extra time.
+            By default False.
+        watermark : str
+            Name of a property, such as a last updated time, that grows when
+            a node or relationship changes.
+            If set, only the nodes and relationships with a watermark above
+            the largest one copied by the last transfer are copied.
+            Vertices whose keys are already in a frame are updated.
+            Requires the neo4j-bolt driver and cannot be combined with
+            partitions, paging or single_pass.
+            By default None.
+        watermark_state : str
+            Path of a file recording the largest watermark copied to each
+            frame.
+            Required when watermark is set.
+        watermark_insert_only : bool
+            Set to true to confirm the watermark of relationships is only set
+            when they are created.
+            Edge frames have no key, so a changed relationship would be
+            copied again, and copying relationship types with a watermark
+            requires this.
+            By default False.
 
         Returns
         -------
-            None
+        list or None
+            If explain is set, a list with a dictionary for each extraction
+            query holding its frame, query, operators, estimated_rows, rows
+            and db_hits, otherwise None.
         """
-        def xlate_result_property(attr, attr_type) -> str:
-            if self._neo4j_driver._arrow_driver is not None and (attr_type == 'datetime' or attr_type == 'date' or attr_type == 'time'):
-                return f", toString(v.{a}) as {a}"
-            return f", v.{a} AS {a}"
-        # Use the count store to get totals.
-        estimated_counts = 0
-        for vertex in xgt_schemas['vertices']:
-            # On transfer on unlabeled vertices we can't get accurate
-            # estimates so assume every vertex.
-            if vertex == '':
-                q = f"MATCH (v) RETURN count(v)"
-                with self._neo4j_driver.query(q, False) as query:
-                    for record in query.result():
-                        estimated_counts = record[0]
-                break
-            q = f"MATCH (v:{vertex}) RETURN count(v)"
-            with self._neo4j_driver.query(q, False) as query:
-                for record in query.result():
-                    estimated_counts += record[0]
-        for edge, schema_list in xgt_schemas['edges'].items():
-            for schema in schema_list:
-                source = schema['source']
-                target = schema['target']
-                match_type = schema['empty_labels']
-                # We can't use both source and target, because that won't use
-                # the count store.
-                if match_type == self._Labels.SOURCE_EMPTY:
-                    q = f"MATCH ()-[e:{edge}]->(:{target}) RETURN count(e)"
-                elif match_type == self._Labels.TARGET_EMPTY:
-                    q = f"MATCH (:{source})-[e:{edge}]->() RETURN count(e)"
-                else:
-                    q = f"MATCH ()-[e:{edge}]->() RETURN count(e)"
-                with self._neo4j_driver.query(q, False) as query:
-                    for record in query.result():
-                        estimated_counts += record[0]
+        if watermark is not None:
+            if watermark_state is None:
+                raise ValueError("Incremental transfers require a watermark_state.")
+            if (partitions != 1 or page_size is not None or
+                checkpoint is not None or single_pass):
+                raise ValueError("Incremental transfers cannot be combined with "
+                                 "partitions, paging or single pass extraction.")
+            if (self._neo4j_driver._py2neo_driver is not None or
+                self._neo4j_driver._arrow_driver is not None):
+                raise ValueError("Incremental transfers require the neo4j-bolt driver.")
+            self.__check_watermark_edges(xgt_schemas, watermark_insert_only)
+        if single_pass:
+            if page_size is not None or checkpoint is not None:
+                raise ValueError("Single pass extraction cannot be combined with paging.")
+            if (self._neo4j_driver._py2neo_driver is not None or
+                self._neo4j_driver._arrow_driver is not None):
+                raise ValueError("Single pass extraction requires the neo4j-bolt driver.")
+        if resume and checkpoint is None:
+            raise ValueError("Resuming a transfer requires a checkpoint.")
+        if checkpoint is not None and page_size is None:
+            page_size = self._DEFAULT_PAGE_SIZE
+        if page_size is not None:
+            if page_size < 1:
+                raise ValueError(f"Page size must be positive, not {page_size}.")
+            if partitions != 1:
+                raise ValueError("Paging cannot be combined with partitions.")
+            if (self._neo4j_driver._py2neo_driver is not None or
+                self._neo4j_driver._arrow_driver is not None):
+                raise ValueError("Paging requires the neo4j-bolt driver.")
+        state = None if checkpoint is None else _JSONState(checkpoint)
+        for count in (partitions.values() if isinstance(partitions, dict)
+                      else (partitions,)):
+            if not isinstance(count, int) or count < 1:
+                raise ValueError(f"Partitions must be a positive integer, not {count}.")
+        vertex_copies, edge_copies, estimated_counts = self.__extractions(
+            xgt_schemas, partitions, single_pass)
+
+        report = None
+        if explain:
+            report = self.__explain_extractions(vertex_copies + edge_copies,
+                                                explain == 'profile')
+
+        if state is not None and not resume:
+            # Frames recorded by an earlier transfer are started over.
+            for extraction in vertex_copies + edge_copies:
+                state.remove(self.__checkpoint_key(extraction.frame))
+
+        watermarks = None
+        if watermark is not None:
+            watermarks = _JSONState(watermark_state)
 
         with ProgressDisplay(estimated_counts) as progress_bar:
-            for vertex, schema in xgt_schemas['vertices'].items():
-                if self.__verbose:
-                    print(f'Copy data for vertex {vertex} into schema: {schema}')
-                table_schema = schema['schema']
-                attributes = {_:t for _, t, *_unused_ in table_schema}
-                key = schema['key']
-                if vertex != '':
-                    query = f"MATCH (v:{vertex}) RETURN id(v) AS {key}"  # , {', '.join(attributes)}"
+            def copy_extraction(extraction):
+                if watermarks is not None:
+                    self.__watermark_copy_data(extraction, watermark,
+                                               watermarks, progress_bar)
+                elif len(extraction.routes) > 0:
+                    self.__routed_copy_data(extraction, progress_bar)
+                elif page_size is not None:
+                    self.__paged_copy_data(extraction, page_size, state,
+                                           resume, progress_bar)
                 else:
-                    query = f"MATCH (v) where size(labels(v)) = 0 RETURN id(v) AS {key}"  # , {', '.join(attributes)}"
-                for a in attributes:
-                    if a != key:
-                        query += xlate_result_property(a, attributes[a]) # f", v.{a} AS {a}"
-                # Is an empty vertex type if None:
-                if schema['neo4j_schema'] is not None:
-                    self.__copy_data(query, schema['xgt_name'], schema['neo4j_schema'], progress_bar)
-            for edge, schema_list in xgt_schemas['edges'].items():
-                if self.__verbose:
-                    print(f'Copy data for node {edge} into schema: {schema_list}')
-                transform = True if len(schema_list) > 1 else False
-                for schema in schema_list:
-                    name = self.__edge_name_transform(schema['xgt_name'], schema['xgt_source'], schema['xgt_target'], transform)
-                    table_schema = schema['schema']
-                    attributes = {_:t for _, t, *_unused_ in table_schema}
-                    source = schema['source']
-                    source_key = schema['source_key']
-                    target = schema['target']
-                    target_key = schema['target_key']
-                    match_type = schema['empty_labels']
-                    if match_type == self._Labels.HAS_BOTH:
-                        query = f"MATCH (u:{source})-[e:{edge}]->(v:{target}) RETURN"
-                    elif match_type == self._Labels.BOTH_EMPTY:
-                        query = f"MATCH (u)-[e:{edge}]->(v) where size(labels(u)) = 0 and size(labels(v)) = 0 RETURN"
-                    elif match_type == self._Labels.SOURCE_EMPTY:
-                        query = f"MATCH (u)-[e:{edge}]->(v:{target}) where size(labels(u)) = 0 RETURN"
-                    elif match_type == self._Labels.TARGET_EMPTY:
-                        query = f"MATCH (u:{source})-[e:{edge}]->(v) where size(labels(v)) = 0 RETURN"
-                    query += f" id(u) AS {source_key}"
-                    query += f", id(v) AS {target_key}"
-                    for a in attributes:
-                        if a != source_key and a != target_key:
-                            query += f", e.{a} AS {a}"
-                    self.__copy_data(query, name, schema['neo4j_schema'], progress_bar)
-        return  None
+                    self.__copy_extraction(extraction, partitions, progress_bar)
+            self.__run_copies(vertex_copies, edge_copies, copy_extraction)
+        return report
 
     def transfer_to_xgt(self, vertices = None, edges = None,
                         neo4j_id_name = 'neo4j_id',
                         neo4j_source_node_name = 'neo4j_source',
                         neo4j_target_node_name = 'neo4j_target',
                         append = False, force = False,
-                        import_edge_nodes = True) -> None:
+                        import_edge_nodes = True, partitions = 1,
+                        page_size = None, checkpoint = None,
+                        resume = False, single_pass = False,
+                        explain = False, watermark = None,
+                        watermark_state = None, watermark_insert_only = False):
         """
         Copies data from Neo4j to Rocketgraph xGT.
 
@@ -777,16 +1290,264 @@ class Neo4jConnector(object):
         import_edge_nodes : boolean
             Add vertices from edge if not explicitly listed.
             By default True.
+        partitions : int or dict
+            Number of Neo4j id ranges to split the extraction of a label or
+            relationship type into, each extracted by its own worker process.
+            See :py:meth:`~Neo4jConnector.copy_data_to_xgt`.
+            By default 1.
+        page_size : int
+            If set, extract in pages of this many rows, each committed to xGT
+            before the next.
+            See :py:meth:`~Neo4jConnector.copy_data_to_xgt`.
+            By default None.
+        checkpoint : str
+            Path of a file recording the progress of a paged transfer.
+            By default None.
+        resume : bool
+            If true, continue an interrupted transfer from the checkpoint.
+            The frames are appended to instead of being recreated.
+            By default False.
+        single_pass : bool
+            If true, read a relationship type connecting several pairs of
+            labels once instead of once per pair, and nodes with several
+            labels once instead of once per label.
+            See :py:meth:`~Neo4jConnector.copy_data_to_xgt`.
+            By default False.
+        explain : bool or str
+            If true, report the plans of the extraction queries before the
+            copy starts.
+            See :py:meth:`~Neo4jConnector.copy_data_to_xgt`.
+            By default False.
+        watermark : str
+            Name of a property that grows when a node or relationship
+            changes, to only copy what changed since the last transfer.
+            The frames are appended to instead of being recreated.
+            See :py:meth:`~Neo4jConnector.copy_data_to_xgt`.
+            By default None.
+        watermark_state : str
+            Path of a file recording the largest watermark copied to each
+            frame.
+            Required when watermark is set.
+        watermark_insert_only : bool
+            Set to true to confirm the watermark of relationships is only set
+            when they are created, which copying relationship types with a
+            watermark requires.
+            By default False.
 
         Returns
         -------
-            None
+        list or None
+            The report on the extraction queries if explain is set,
+            otherwise None.
         """
+        if resume and checkpoint is None:
+            raise ValueError("Resuming a transfer requires a checkpoint.")
         xgt_schema = self.get_xgt_schemas(vertices, edges,
                 neo4j_id_name, neo4j_source_node_name, neo4j_target_node_name,
                 import_edge_nodes)
-        self.create_xgt_schemas(xgt_schema, append, force)
-        self.copy_data_to_xgt(xgt_schema)
+        if watermark is not None:
+            self.__check_watermark_edges(xgt_schema, watermark_insert_only)
+        self.create_xgt_schemas(xgt_schema, append or resume or watermark is not None,
+                                force)
+        return self.copy_data_to_xgt(xgt_schema, partitions, page_size,
+                                     checkpoint, resume, single_pass, explain,
+                                     watermark, watermark_state,
+                                     watermark_insert_only)
+
+    async def async_copy_data_to_xgt(self, xgt_schemas):
+        """
+        Copies data from Neo4j to the requested vertex and/or edge frames
+        in Rocketgraph xGT from within an asyncio event loop.
+
+        Each label and relationship type is extracted by its own coroutine
+        over a session of an async bolt driver, with up to the driver's
+        max_workers extracted at the same time.
+        Writing to xGT runs on the event loop's default executor, so the
+        loop isn't blocked by the transfer.
+
+        Parameters
+        ----------
+        xgt_schemas : dict
+            Dictionary containing schema information for vertex and edge frames
+            to create in xGT.
+            This dictionary can be the value returned from the
+            :py:meth:`~Neo4jConnector.get_xgt_schemas` method.
+
+        Returns
+        -------
+        None
+        """
+        self.__check_async_driver()
+        loop = asyncio.get_running_loop()
+        vertex_copies, edge_copies, estimated_counts = await loop.run_in_executor(
+            None, self.__extractions, xgt_schemas)
+        workers = asyncio.Semaphore(getattr(self._neo4j_driver, '_max_workers', 1))
+        driver = self._neo4j_driver._async_bolt()
+        try:
+            with ProgressDisplay(estimated_counts) as progress_bar:
+                vertex_tasks = { }
+                async def copy_extraction(extraction):
+                    # Wait for the endpoint vertex frames to be committed
+                    # before taking a session.
+                    for endpoint in extraction.endpoints:
+                        if endpoint in vertex_tasks:
+                            await vertex_tasks[endpoint]
+                    async with workers:
+                        await self.__async_bolt_copy_data(driver, extraction,
+                                                          progress_bar)
+
+                for extraction in vertex_copies:
+                    vertex_tasks[extraction.frame] = loop.create_task(
+                        copy_extraction(extraction))
+                tasks = list(vertex_tasks.values()) + [
+                    loop.create_task(copy_extraction(extraction))
+                    for extraction in edge_copies]
+                try:
+                    await asyncio.gather(*tasks)
+                except BaseException:
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions = True)
+                    raise
+        finally:
+            await driver.close()
+
+    async def async_transfer_to_xgt(self, vertices = None, edges = None,
+                                    neo4j_id_name = 'neo4j_id',
+                                    neo4j_source_node_name = 'neo4j_source',
+                                    neo4j_target_node_name = 'neo4j_target',
+                                    append = False, force = False,
+                                    import_edge_nodes = True):
+        """
+        Copies data from Neo4j to Rocketgraph xGT from within an asyncio
+        event loop.
+
+        The schemas are inferred and the frames created like
+        :py:meth:`~Neo4jConnector.transfer_to_xgt` on the event loop's
+        default executor, and the data is copied with
+        :py:meth:`~Neo4jConnector.async_copy_data_to_xgt`.
+        Requires the neo4j-bolt driver with a Neo4jDriver created from a host.
+
+        Parameters
+        ----------
+        vertices : iterable
+            List of requested node labels (vertex frame names) as a string or tuple.
+            See :py:meth:`~Neo4jConnector.transfer_to_xgt`.
+        edges : iterable
+            List of requested relationship type (edge frame) names or tuple.
+            See :py:meth:`~Neo4jConnector.transfer_to_xgt`.
+        neo4j_id_name : str
+            The name of the xGT column holding the Neo4j node's ID value.
+        neo4j_source_node_name : str
+            The name of the xGT column holding the source node's ID value.
+        neo4j_target_node_name : str
+            The name of the xGT column holding the target node's ID value.
+        append : boolean
+            Set to true when the xGT frames are already created and holding data
+            that should be appended to.
+        force : boolean
+            Set to true to force xGT to drop edges when a vertex frame has dependencies.
+        import_edge_nodes : boolean
+            Add vertices from edge if not explicitly listed.
+            By default True.
+
+        Returns
+        -------
+        None
+        """
+        self.__check_async_driver()
+        loop = asyncio.get_running_loop()
+        def create_schemas():
+            xgt_schema = self.get_xgt_schemas(vertices, edges,
+                    neo4j_id_name, neo4j_source_node_name,
+                    neo4j_target_node_name, import_edge_nodes)
+            self.create_xgt_schemas(xgt_schema, append, force)
+            return xgt_schema
+        xgt_schema = await loop.run_in_executor(None, create_schemas)
+        await self.async_copy_data_to_xgt(xgt_schema)
+
+    def transfer_subgraph_to_xgt(self, seeds, hops = 1, rel_types = None,
+                                 neo4j_id_name = 'neo4j_id',
+                                 neo4j_source_node_name = 'neo4j_source',
+                                 neo4j_target_node_name = 'neo4j_target',
+                                 append = False, force = False,
+                                 batch_size = 10000) -> None:
+        """
+        Copies the neighborhood of seed nodes from Neo4j to Rocketgraph xGT.
+
+        Starting from the seed nodes, the relationships of each reached
+        node are followed in both directions up to hops times.
+        The nodes reached and the relationships followed are copied into
+        the same frames transfer_to_xgt creates for their labels and
+        relationship types.
+
+        Parameters
+        ----------
+        seeds : iterable or str
+            Neo4j ids of the seed nodes, or a Cypher query returning them in
+            its first column.
+        hops : int
+            Number of relationships to follow from the seeds.
+            By default 1.
+        rel_types : iterable
+            Relationship types to follow.
+            If None, all relationship types are followed.
+        neo4j_id_name : str
+            The name of the xGT column holding the Neo4j node's ID value.
+        neo4j_source_node_name : str
+            The name of the xGT column holding the source node's ID value.
+        neo4j_target_node_name : str
+            The name of the xGT column holding the target node's ID value.
+        append : boolean
+            Set to true when the xGT frames are already created and holding data
+            that should be appended to.
+            Set to false when the xGT frames are to be newly created (removing
+            any existing frames with the same names prior to creation).
+        force : boolean
+            Set to true to force xGT to drop edges when a vertex frame has dependencies.
+        batch_size : int
+            Number of nodes expanded, or nodes and relationships read, with
+            each query.
+            By default 10000.
+
+        Returns
+        -------
+            None
+        """
+        if hops < 0:
+            raise ValueError(f"Hops must not be negative, not {hops}.")
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be positive, not {batch_size}.")
+        if (self._neo4j_driver._py2neo_driver is not None or
+            self._neo4j_driver._arrow_driver is not None):
+            raise ValueError("Subgraph transfers require the neo4j-bolt driver.")
+        if isinstance(seeds, str):
+            with self._neo4j_driver.query(seeds, False, True) as query:
+                seeds = [record[0] for record in query.result()]
+
+        nodes, relationships = self.__expand_subgraph(seeds, hops, rel_types, batch_size)
+        labels = set()
+        for node_labels in self.__subgraph_values(
+                "MATCH (v) WHERE id(v) IN $ids RETURN DISTINCT labels(v) AS value",
+                nodes, batch_size):
+            labels.update(node_labels if len(node_labels) > 0
+                          else [self.__neo4j_unlabeled_vertex_name()])
+        types = set(self.__subgraph_values(
+            "MATCH ()-[e]->() WHERE id(e) IN $ids RETURN DISTINCT type(e) AS value",
+            relationships, batch_size))
+        if self.__verbose:
+            print(f"Subgraph of {len(nodes)} nodes with labels {labels} and "
+                  f"{len(relationships)} relationships of types {types}")
+
+        xgt_schemas = self.get_xgt_schemas(sorted(labels), sorted(types),
+                neo4j_id_name, neo4j_source_node_name, neo4j_target_node_name)
+        self.create_xgt_schemas(xgt_schemas, append, force)
+        vertex_copies, edge_copies, _ = self.__extractions(xgt_schemas)
+        with ProgressDisplay(len(nodes) + len(relationships)) as progress_bar:
+            def copy_extraction(extraction):
+                ids = nodes if extraction.id_variable == 'v' else relationships
+                self.__subgraph_copy_data(extraction, ids, batch_size, progress_bar)
+            self.__run_copies(vertex_copies, edge_copies, copy_extraction)
         return None
 
     def transfer_to_neo4j(self, vertices = None, edges = None, namespace = None,
@@ -1010,17 +1771,122 @@ class Neo4jConnector(object):
             pass
         return False
 
+    def __neo4j_counts(self, patterns):
+        # Counts of the nodes or relationships matching count store patterns
+        # like (:Label) or ()-[:TYPE]->(:Label), fetched in one round trip
+        # and kept until the schema is refreshed.
+        missing = [pattern for pattern in set(patterns)
+                   if pattern not in self._neo4j_counts]
+        if len(missing) > 0 and self._neo4j_has_apoc and not self._neo4j_counts:
+            q = "CALL apoc.meta.stats() YIELD nodeCount, labels, relTypesCount, relTypes RETURN *"
+            with self._neo4j_driver.query(q, False, True) as query:
+                for record in query.result():
+                    self._neo4j_counts["()"] = record['nodeCount']
+                    for label, count in record['labels'].items():
+                        self._neo4j_counts[f"(:{label})"] = count
+                    for rel_type, count in record['relTypesCount'].items():
+                        self._neo4j_counts[f"()-[:{rel_type}]->()"] = count
+                    self._neo4j_counts.update(record['relTypes'])
+            missing = [pattern for pattern in missing
+                       if pattern not in self._neo4j_counts]
+        if len(missing) > 0:
+            subqueries = []
+            for pattern in missing:
+                if "-" in pattern:
+                    match = pattern.replace("[:", "[e:", 1)
+                    subqueries.append(f"MATCH {match} RETURN '{pattern}' AS pattern, count(e) AS count")
+                else:
+                    match = pattern.replace("(", "(v", 1)
+                    subqueries.append(f"MATCH {match} RETURN '{pattern}' AS pattern, count(v) AS count")
+            q = " UNION ALL ".join(subqueries)
+            with self._neo4j_driver.query(q, False, True) as query:
+                for record in query.result():
+                    self._neo4j_counts[record['pattern']] = record['count']
+        # Labels or types missing from the statistics have no elements.
+        return {pattern : self._neo4j_counts.get(pattern, 0) for pattern in patterns}
+
+    def __refresh_snapshot(self):
+        # Makes sure the cached schema comes from a current snapshot.
+        # Returns False when snapshots are disabled, or while one is being
+        # discovered, so the caller queries Neo4j directly.
+        if self._schema_ttl == 0 or self._schema_refreshing:
+            return False
+        snapshot = self._schema_snapshot
+        fingerprint = self.__neo4j_fingerprint()
+        expired = (snapshot is None or (self._schema_ttl is not None and
+                   time.time() - snapshot.created > self._schema_ttl))
+        if expired or fingerprint != snapshot.fingerprint:
+            if self.__verbose:
+                print("Discovering the Neo4j schema.")
+            self._schema_refreshing = True
+            try:
+                counts = self._neo4j_counts
+                self.__update_cache_state()
+                self._neo4j_counts = counts
+            finally:
+                self._schema_refreshing = False
+            snapshot = _SchemaSnapshot(self._neo4j_node_type_properties,
+                                       self._neo4j_rel_type_properties,
+                                       self._neo4j_edges, fingerprint,
+                                       confidence = self._neo4j_schema_confidence)
+            self._schema_snapshot = snapshot
+            self._schema_applied = snapshot
+            if self._schema_cache is not None:
+                self._schema_cache.set(self.__schema_cache_key(),
+                                       snapshot.to_dict())
+        elif self._schema_applied is not snapshot:
+            self._neo4j_node_type_properties = snapshot.node_type_properties
+            self._neo4j_rel_type_properties = snapshot.rel_type_properties
+            self._neo4j_nodes = self.__neo4j_process_nodes(snapshot.node_type_properties)
+            self._neo4j_edges = snapshot.edges
+            self._neo4j_schema_confidence = snapshot.confidence
+            self._neo4j_relationship_types = None
+            self._neo4j_node_labels = None
+            self._schema_applied = snapshot
+        self._neo4j_property_keys = fingerprint['property_keys']
+        return True
+
+    def __neo4j_fingerprint(self):
+        q = ("CALL db.labels() YIELD label "
+             "RETURN 'labels' AS kind, collect(label) AS names "
+             "UNION ALL CALL db.relationshipTypes() YIELD relationshipType "
+             "RETURN 'types' AS kind, collect(relationshipType) AS names "
+             "UNION ALL CALL db.propertyKeys() YIELD propertyKey "
+             "RETURN 'keys' AS kind, collect(propertyKey) AS names")
+        names = {'labels' : [], 'types' : [], 'keys' : []}
+        with self._neo4j_driver.query(q, False, True) as query:
+            for record in query.result():
+                names[record['kind']] = sorted(record['names'])
+        # The counts are read fresh and kept for progress estimates.
+        self._neo4j_counts = { }
+        counts = self.__neo4j_counts([f"(:{label})" for label in names['labels']] +
+                                     [f"()-[:{rel_type}]->()" for rel_type in names['types']])
+        return {'labels' : {label : counts[f"(:{label})"]
+                            for label in names['labels']},
+                'types' : {rel_type : counts[f"()-[:{rel_type}]->()"]
+                           for rel_type in names['types']},
+                'property_keys' : names['keys']}
+
+    def __schema_cache_key(self):
+        settings = getattr(self._neo4j_driver, '_bolt_settings', None)
+        uri = '' if settings is None else settings['uri']
+        database = self._neo4j_driver._database
+        return f"{uri}/{'' if database is None else database}"
+
     def __neo4j_property_keys(self, flush_cache = True):
-        if flush_cache:
+        if flush_cache and not self.__refresh_snapshot():
             with self._neo4j_driver.query("CALL db.propertyKeys() YIELD propertyKey RETURN propertyKey", False) as query:
                 self._neo4j_property_keys = list([record["propertyKey"] for record in query.result()])
                 self._neo4j_property_keys.sort()
         return self._neo4j_property_keys
 
     def __neo4j_node_type_properties(self, flush_cache = True):
-        if flush_cache:
+        if flush_cache and not self.__refresh_snapshot():
             fields = ('nodeType', 'nodeLabels', 'propertyName', 'propertyTypes', 'mandatory')
-            if self._neo4j_has_apoc:
+            self._neo4j_schema_confidence['nodes'] = { }
+            if self._schema_sample is not None:
+                self._neo4j_node_type_properties = self.__neo4j_sampled_node_type_properties()
+            elif self._neo4j_has_apoc:
                 q="CALL apoc.meta.nodeTypeProperties() YIELD nodeType, nodeLabels, propertyName, propertyTypes, mandatory RETURN *"
                 with self._neo4j_driver.query(q, False) as query:
                     self._neo4j_node_type_properties = [{_ : record[_] for _ in fields} for record in query.result()]
@@ -1035,9 +1901,12 @@ class Neo4jConnector(object):
         return self._neo4j_node_type_properties
 
     def __neo4j_rel_type_properties(self, flush_cache = True):
-        if flush_cache:
+        if flush_cache and not self.__refresh_snapshot():
             fields = ('relType', 'propertyName', 'propertyTypes', 'mandatory')
-            if self._neo4j_has_apoc:
+            self._neo4j_schema_confidence['edges'] = { }
+            if self._schema_sample is not None:
+                self._neo4j_rel_type_properties = self.__neo4j_sampled_rel_type_properties()
+            elif self._neo4j_has_apoc:
                 q="CALL apoc.meta.relTypeProperties() YIELD relType, propertyName, propertyTypes, mandatory RETURN *"
                 with self._neo4j_driver.query(q, False) as query:
                     self._neo4j_rel_type_properties = [{_ : record[_] for _ in fields} for record in query.result()]
@@ -1052,96 +1921,202 @@ class Neo4jConnector(object):
                     self._neo4j_rel_type_properties = [{_ : record[_] for _ in fields} for record in query.result()]
         return self._neo4j_rel_type_properties
 
+    def __neo4j_sampled_node_type_properties(self):
+        # Infers the node properties from at most schema_sample nodes of
+        # each label. With APOC the labels are sampled by the procedure,
+        # reading every n-th node so the largest label is read about
+        # schema_sample times. Unlabeled nodes are always sampled here.
+        fields = ('nodeType', 'nodeLabels', 'propertyName', 'propertyTypes', 'mandatory')
+        sample = int(self._schema_sample)
+        with self._neo4j_driver.query("CALL db.labels() YIELD label RETURN label", False, True) as query:
+            labels = [record['label'] for record in query.result()]
+        counts = self.__neo4j_counts([f"(:{label})" for label in labels])
+        counts = {label : counts[f"(:{label})"] for label in labels}
+
+        returns = " RETURN id(n) AS id, labels(n) AS labels, properties(n) AS properties"
+        unlabeled = self.__neo4j_sample(
+            f"MATCH (n) WHERE size(labels(n)) = 0 WITH n LIMIT {sample}" + returns)
+        if self._neo4j_has_apoc:
+            skip = max(1, -(-max(counts.values(), default = 0) // sample))
+            q = (f"CALL apoc.meta.nodeTypeProperties({{sample: {skip}}}) "
+                 "YIELD nodeType, nodeLabels, propertyName, propertyTypes, mandatory RETURN *")
+            with self._neo4j_driver.query(q, False, True) as query:
+                records = [{_ : record[_] for _ in fields} for record in query.result()]
+            samples = []
+            confidence = {label : min(1.0, -(-count // skip) / count) if count > 0 else 1.0
+                          for label, count in counts.items()}
+        else:
+            records = []
+            samples = self.__neo4j_map(self.__neo4j_sample,
+                                       [f"MATCH (n:`{label}`) WITH n LIMIT {sample}" + returns
+                                        for label in labels])
+            confidence = {label : min(1.0, len(found) / counts[label]) if counts[label] > 0 else 1.0
+                          for label, found in zip(labels, samples)}
+        # How many unlabeled nodes there are isn't known.
+        confidence[self.__neo4j_unlabeled_vertex_name()] = 1.0 if len(unlabeled) < sample else None
+
+        # Nodes with several labels can be in the sample of each label.
+        seen = set()
+        unique = []
+        for found in [unlabeled] + samples:
+            for record in found:
+                if record['id'] not in seen:
+                    seen.add(record['id'])
+                    unique.append((sorted(record['labels']), record['properties']))
+        records += [dict(zip(fields, record)) for record in _neo4j_sampled_properties(unique)]
+
+        for record in records:
+            if record['propertyName'] is None:
+                continue
+            for label in record['nodeLabels'] or [self.__neo4j_unlabeled_vertex_name()]:
+                if confidence.get(label, 1.0) != 1.0:
+                    self._neo4j_schema_confidence['nodes'].setdefault(
+                        label, { })[record['propertyName']] = confidence[label]
+        return records
+
+    def __neo4j_sampled_rel_type_properties(self):
+        # Infers the relationship properties from at most schema_sample
+        # relationships of each type, passed to APOC as maxRels.
+        fields = ('relType', 'propertyName', 'propertyTypes', 'mandatory')
+        sample = int(self._schema_sample)
+        with self._neo4j_driver.query("CALL db.relationshipTypes() YIELD relationshipType RETURN relationshipType", False, True) as query:
+            rel_types = [record['relationshipType'] for record in query.result()]
+        counts = self.__neo4j_counts([f"()-[:{rel_type}]->()" for rel_type in rel_types])
+        counts = {rel_type : counts[f"()-[:{rel_type}]->()"] for rel_type in rel_types}
+        confidence = {rel_type : min(1.0, sample / count) if count > 0 else 1.0
+                      for rel_type, count in counts.items()}
+
+        records = []
+        if self._neo4j_has_apoc:
+            q = (f"CALL apoc.meta.relTypeProperties({{maxRels: {sample}}}) "
+                 "YIELD relType, propertyName, propertyTypes, mandatory RETURN *")
+            with self._neo4j_driver.query(q, False, True) as query:
+                records = [{_ : record[_] for _ in fields} for record in query.result()]
+        # Get edges attached to unlabeled nodes. APOC has a bug...
+        found = {record['relType'] for record in records}
+        rel_types = [rel_type for rel_type in rel_types if f":`{rel_type}`" not in found]
+        queries = [f"MATCH ()-[e:`{rel_type}`]->() WITH e LIMIT {sample} "
+                   "RETURN properties(e) AS properties" for rel_type in rel_types]
+        samples = self.__neo4j_map(self.__neo4j_sample, queries)
+        for rel_type, found in zip(rel_types, samples):
+            sampled = _neo4j_sampled_properties(([rel_type], values['properties'])
+                                                for values in found)
+            if len(sampled) == 0:
+                sampled = [(f":`{rel_type}`", None, None, None, False)]
+            records += [{'relType' : node_type, 'propertyName' : name,
+                         'propertyTypes' : types, 'mandatory' : mandatory}
+                        for node_type, _, name, types, mandatory in sampled]
+            if counts[rel_type] > 0:
+                confidence[rel_type] = min(1.0, len(found) / counts[rel_type])
+
+        for record in records:
+            rel_type = record['relType']
+            if rel_type[0:2] == ':`' and rel_type[-1] == '`':
+                rel_type = rel_type[2:-1]
+            if record['propertyName'] is not None and confidence.get(rel_type, 1.0) != 1.0:
+                self._neo4j_schema_confidence['edges'].setdefault(
+                    rel_type, { })[record['propertyName']] = confidence[rel_type]
+        return records
+
+    def __neo4j_sample(self, q):
+        with self._neo4j_driver.query(q, False, True) as query:
+            return [{key : record[key] for key in record.keys()}
+                    for record in query.result()]
+
+    def __neo4j_map(self, function, items):
+        # Runs function on each of items, concurrently up to the driver's
+        # max_workers, and returns the results in order.
+        items = list(items)
+        max_workers = min(getattr(self._neo4j_driver, '_max_workers', 1),
+                          len(items))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers = max_workers) as executor:
+                return list(executor.map(function, items))
+        return [function(item) for item in items]
+
     def __add_neo4j_schema_connectivity_to_neo4j_edges(self) -> None:
         def extract_node_info(node):
             labels = node.labels
             if len(labels) == 1:
                 return list(labels)[0]
             return labels
+
+        for e_type in self._neo4j_edges:
+            self._neo4j_edges[e_type]['endpoints'] = set()
+            self._neo4j_edges[e_type]['sources'] = set()
+            self._neo4j_edges[e_type]['targets'] = set()
+
         if self._neo4j_has_apoc:
+            # TODO(landwehrj) Can schema be done with py2neo?
             q="CALL apoc.meta.graph()"
-        else:
-            q="CALL db.schema.visualization() YIELD nodes, relationships RETURN *"
-        # TODO(landwehrj) Can schema be done with py2neo?
-        with self._neo4j_driver.query(q, False, True) as query:
-            for record in query.result():
-                has_multiple_relations = len(record['relationships']) > 1
-                for e in record['relationships']:
-                    nodes = e.nodes
-                    source = nodes[0]
-                    target = nodes[1]
-                    e_type = e.type
-
-                    source_name = extract_node_info(source)
-                    target_name = extract_node_info(target)
-
-                    if not self._neo4j_has_apoc and has_multiple_relations:
-                        # Neo4j does not return the correct schema for multi-edges
-                        # without APOC so we need to do additional queries to filter fake edges:
-                        # See https://github.com/neo4j/neo4j/issues/9726
-                        schema_exists = False
-                        q = f"MATCH (:{source_name})-[e:{e_type}]->(:{target_name}) return count(e) > 0"
-                        with self._neo4j_driver.query(q, False) as query:
-                            for result in query.result():
-                                schema_exists = result[0]
-
-                        if (not schema_exists):
-                            continue
-                    if self.__verbose:
-                        print(f"Edge Connectivity: {e}")
-                        print(f" -> type => {e_type}")
-                        print(f" -> source nodes => {source}")
-                        print(f" -> target nodes => {nodes[1]}")
-                        print(f"  -> Edge {e_type}: {self._neo4j_edges[e_type]}\n")
-                    if 'endpoints' not in self._neo4j_edges[e_type]:
-                        self._neo4j_edges[e_type]['endpoints'] = set()
-                        self._neo4j_edges[e_type]['sources'] = set()
-                        self._neo4j_edges[e_type]['targets'] = set()
-                    self._neo4j_edges[e_type]['endpoints'].add(
-                        (extract_node_info(source), extract_node_info(target)))
-                    self._neo4j_edges[e_type]['sources'].add(extract_node_info(source))
-                    self._neo4j_edges[e_type]['targets'].add(extract_node_info(target))
-
-        vertices = [vertex for vertex in self.__neo4j_node_labels(False)]
-        for e_type in self._neo4j_edges:
-            if 'endpoints' not in self._neo4j_edges[e_type]:
-                # We have an edge with one or more non-typed vertex.
-                # These aren't picked up be Neo4j or APOC with the above methods.
-
-                self._neo4j_edges[e_type]['endpoints'] = set()
-                self._neo4j_edges[e_type]['sources'] = set()
-                self._neo4j_edges[e_type]['targets'] = set()
-
-                for v in vertices:
-                    if v == self.__neo4j_unlabeled_vertex_name():
-                        continue
-                    schema_exists = False
-                    q = f"MATCH (:{v})-[e:{e_type}]->() return count(e) > 0"
-                    with self._neo4j_driver.query(q, False) as query:
-                        for result in query.result():
-                            schema_exists = result[0]
-
-                    if (schema_exists):
-                        self._neo4j_edges[e_type]['sources'].add(v)
-                        self._neo4j_edges[e_type]['endpoints'].add((v, None))
-
-                    q = f"MATCH ()-[e:{e_type}]->(:{v}) return count(e) > 0"
-                    with self._neo4j_driver.query(q, False) as query:
-                        for result in query.result():
-                            schema_exists = result[0]
-
-                    if (schema_exists):
-                        self._neo4j_edges[e_type]['targets'].add(v)
-                        self._neo4j_edges[e_type]['endpoints'].add((None, v))
+            with self._neo4j_driver.query(q, False, True) as query:
+                for record in query.result():
+                    for e in record['relationships']:
+                        nodes = e.nodes
+                        if self.__verbose:
+                            print(f"Edge Connectivity: {e}")
+                            print(f" -> type => {e.type}")
+                            print(f" -> source nodes => {nodes[0]}")
+                            print(f" -> target nodes => {nodes[1]}")
+                            print(f"  -> Edge {e.type}: {self._neo4j_edges[e.type]}\n")
+                        self.__add_neo4j_edge_endpoint(
+                            e.type, extract_node_info(nodes[0]),
+                            extract_node_info(nodes[1]))
+
+        # Without APOC, db.schema.visualization() returns fake multi-edges,
+        # see https://github.com/neo4j/neo4j/issues/9726. Edges with one or
+        # more non-typed vertex aren't picked up by either. Discover those
+        # from the relationships themselves with one aggregated query per
+        # relationship type.
+        e_types = [e_type for e_type in self._neo4j_edges
+                   if len(self._neo4j_edges[e_type]['endpoints']) == 0]
+        discovered = self.__neo4j_map(self.__neo4j_edge_endpoints, e_types)
+
+        for e_type, endpoints in zip(e_types, discovered):
+            if self.__verbose:
+                print(f"Edge Connectivity: {e_type} => {endpoints}")
+            # Keep the fully labeled endpoints when there are any, as the
+            # schema procedures do, and otherwise the half labeled ones.
+            labeled = [(source, target) for source, target in endpoints
+                       if source is not None and target is not None]
+            if len(labeled) == 0:
+                labeled = [(source, target) for source, target in endpoints
+                           if (source is None) != (target is None)]
+            for source, target in labeled:
+                self.__add_neo4j_edge_endpoint(e_type, source, target)
 
+        for e_type in self._neo4j_edges:
             # Failed to find any relevant nodes for this edge.
             if len(self._neo4j_edges[e_type]['endpoints']) == 0:
                 self._neo4j_edges[e_type]['endpoints'].add((None, None))
 
         return None
 
+    def __add_neo4j_edge_endpoint(self, e_type, source, target):
+        self._neo4j_edges[e_type]['endpoints'].add((source, target))
+        if source is not None:
+            self._neo4j_edges[e_type]['sources'].add(source)
+        if target is not None:
+            self._neo4j_edges[e_type]['targets'].add(target)
+
+    def __neo4j_edge_endpoints(self, e_type):
+        # The distinct (source label, target label) pairs of a relationship
+        # type with None for an unlabeled node. Only the first schema_sample
+        # relationships are looked at if set.
+        q = f"MATCH (u)-[e:`{e_type}`]->(v)"
+        if self._schema_sample is not None:
+            q += f" WITH u, v LIMIT {int(self._schema_sample)}"
+        q += " RETURN DISTINCT labels(u) AS sources, labels(v) AS targets"
+        endpoints = set()
+        with self._neo4j_driver.query(q, False, True) as query:
+            for record in query.result():
+                for source in (record['sources'] or [None]):
+                    for target in (record['targets'] or [None]):
+                        endpoints.add((source, target))
+        return endpoints
+
     def __neo4j_nodes(self, flush_cache = True):
-        if flush_cache:
+        if flush_cache and not self.__refresh_snapshot():
             nodes = dict()
             for prop in self.__neo4j_node_type_properties(flush_cache):
                 labels = prop['nodeLabels']
@@ -1208,11 +2183,33 @@ class Neo4jConnector(object):
                 res[relType]['schema'][propName] = propType
         return res
 
-    def __extract_xgt_vertex_schema(self, vertex, neo4j_id_name, xgt_vertex_name, flush_cache = True):
+    def __mapping_filter(self, mapping):
+        # The properties and predicate of a mapping tuple like
+        # ('neo4j_name', 'xgt_name', properties, where).
+        if len(mapping) < 2 or len(mapping) > 4:
+            raise ValueError(f"Mapping {mapping} should be (neo4j_name, xgt_name, properties, where).")
+        properties = mapping[2] if len(mapping) > 2 else None
+        where = mapping[3] if len(mapping) > 3 else None
+        if isinstance(properties, str):
+            properties = [properties]
+        return properties, where
+
+    def __select_properties(self, name, neo4j_properties, properties):
+        # Keeps the requested properties in the order requested.
+        if properties is None:
+            return neo4j_properties
+        for prop in properties:
+            if prop not in neo4j_properties:
+                raise ValueError(f"Property {prop} of {name} is not found.")
+        return {prop : neo4j_properties[prop] for prop in properties}
+
+    def __extract_xgt_vertex_schema(self, vertex, neo4j_id_name, xgt_vertex_name, flush_cache = True,
+                                    properties = None):
         if flush_cache:
             self.__update_cache_state()
         if vertex in self.__neo4j_nodes(False):
-            neo4j_node = self.__neo4j_nodes(False)[vertex]
+            neo4j_node = self.__select_properties(
+                vertex, self.__neo4j_nodes(False)[vertex], properties)
             neo4j_node_attributes = list(neo4j_node.keys())
             if neo4j_id_name in neo4j_node:
                 raise ValueError(
@@ -1231,7 +2228,8 @@ class Neo4jConnector(object):
                                   xgt_edge_name,
                                   xgt_source_name,
                                   xgt_target_name,
-                                  flush_cache = True):
+                                  flush_cache = True,
+                                  properties = None):
         if flush_cache:
           self.__update_cache_state()
         result = dict()
@@ -1240,7 +2238,7 @@ class Neo4jConnector(object):
         edge_info = self.__neo4j_edges(False)[edge]
         if self.__verbose:
             print(f"xGT graph schema for edge {edge}: {edge_info}")
-        info_schema = edge_info['schema']
+        info_schema = self.__select_properties(edge, edge_info['schema'], properties)
         edge_endpoints = edge_info['endpoints']
         endpoints = (source, target)
         if source != None and target != None and endpoints not in edge_endpoints:
@@ -1271,7 +2269,8 @@ class Neo4jConnector(object):
 
     def __extract_xgt_edge_schemas(self, edge, vertices, edges, neo4j_source_node_name,
                                    neo4j_target_node_name,
-                                   import_edge_nodes = True, flush_cache = True):
+                                   import_edge_nodes = True, flush_cache = True,
+                                   properties = None):
         if flush_cache:
           self.__update_cache_state()
         schemas = []
@@ -1306,7 +2305,7 @@ class Neo4jConnector(object):
             result = self.__extract_xgt_edge_schema(edge,
                 source, target, neo4j_source_node_name,
                 neo4j_target_node_name, edges[edge], source_name,
-                target_name, flush_cache)
+                target_name, flush_cache, properties)
             if result is not None:
                 schemas.append(result)
 
@@ -1320,15 +2319,18 @@ class Neo4jConnector(object):
             return self._NEO4J_TYPE_TO_XGT_TYPE[prop_type]
         raise TypeError(f'The "{prop_type}" Neo4j type is not yet supported')
 
-    def __arrow_writer(self, frame_name, schema):
+    def __arrow_writer(self, frame_name, schema, on_duplicate_keys = None):
         try:
             arrow_conn = self._xgt_server.arrow_conn
         except AttributeError:
             # Using xgt 1.10 without arrow_conn
             arrow_conn = pf.FlightClient((self._xgt_server.host, self._xgt_server.port))
             arrow_conn.authenticate(BasicArrowClientAuthHandler())
+        path = (self._default_namespace, frame_name)
+        if on_duplicate_keys is not None:
+            path += (".on_duplicate_keys=" + on_duplicate_keys,)
         writer, _ = arrow_conn.do_put(
-            pf.FlightDescriptor.for_path(self._default_namespace, frame_name),
+            pf.FlightDescriptor.for_path(*path),
             schema)
         return writer
 
@@ -1341,6 +2343,610 @@ class Neo4jConnector(object):
             arrow_conn.authenticate(BasicArrowClientAuthHandler())
         return arrow_conn.do_get(pf.Ticket(self._default_namespace + '__' + frame_name))
 
+    def __run_copies(self, vertex_copies, edge_copies, copy_extraction):
+        max_workers = getattr(self._neo4j_driver, '_max_workers', 1)
+        if max_workers <= 1:
+            for extraction in vertex_copies + edge_copies:
+                copy_extraction(extraction)
+            return
+
+        with ThreadPoolExecutor(max_workers) as executor:
+            vertex_futures = { }
+            for extraction in vertex_copies:
+                future = executor.submit(copy_extraction, extraction)
+                vertex_futures[extraction.frame] = future
+                for frame, *_ in extraction.routes:
+                    vertex_futures[frame] = future
+
+            def copy_edge(extraction):
+                # Wait for the endpoint vertex frames to be committed.
+                # The vertex copies were queued first, so they are all
+                # running or done by the time an edge copy starts.
+                for endpoint in extraction.endpoints:
+                    if endpoint in vertex_futures:
+                        vertex_futures[endpoint].result()
+                copy_extraction(extraction)
+
+            edge_futures = [executor.submit(copy_edge, extraction)
+                            for extraction in edge_copies]
+            for future in list(vertex_futures.values()) + edge_futures:
+                future.result()
+
+    def __extractions(self, xgt_schemas, partitions = 1, single_pass = False):
+        # The extractions copying the frames of xgt_schemas, and the
+        # estimated number of rows they copy.
+        def xlate_result_property(attr, attr_type) -> str:
+            if self._neo4j_driver._arrow_driver is not None and (attr_type == 'datetime' or attr_type == 'date' or attr_type == 'time'):
+                return f", toString(v.{a}) as {a}"
+            return f", v.{a} AS {a}"
+        # Use the count store to get totals.
+        vertex_patterns = []
+        for vertex in xgt_schemas['vertices']:
+            # On transfer on unlabeled vertices we can't get accurate
+            # estimates so assume every vertex.
+            if vertex == '':
+                vertex_patterns = ["()"]
+                break
+            vertex_patterns.append(f"(:{vertex})")
+        edge_patterns = []
+        plan_patterns = []
+        labels = []
+        if len(xgt_schemas['edges']) > 0:
+            labels = [label for label in self.__neo4j_schema_labels()
+                      if label != self.__neo4j_unlabeled_vertex_name()]
+        for edge, schema_list in xgt_schemas['edges'].items():
+            for schema in schema_list:
+                source = schema['source']
+                target = schema['target']
+                match_type = schema['empty_labels']
+                # We can't use both source and target, because that won't use
+                # the count store.
+                if match_type == self._Labels.SOURCE_EMPTY:
+                    edge_patterns.append(f"()-[:{edge}]->(:{target})")
+                elif match_type == self._Labels.TARGET_EMPTY:
+                    edge_patterns.append(f"(:{source})-[:{edge}]->()")
+                else:
+                    edge_patterns.append(f"()-[:{edge}]->()")
+                plan_patterns += self.__edge_plan_patterns(
+                    edge, match_type, source, target, labels)
+        # The counts used to plan the queries are read in the same query.
+        counts = self.__neo4j_counts(vertex_patterns + edge_patterns + plan_patterns)
+        estimated_counts = sum(counts[pattern]
+                               for pattern in vertex_patterns + edge_patterns)
+
+        vertex_copies = []
+        single_pass_vertices = set()
+        if single_pass:
+            vertex_copies = self.__single_pass_vertex_extractions(
+                xgt_schemas['vertices'], partitions)
+            for extraction in vertex_copies:
+                single_pass_vertices.update(extraction.name)
+        for vertex, schema in xgt_schemas['vertices'].items():
+            if vertex in single_pass_vertices:
+                continue
+            if self.__verbose:
+                print(f'Copy data for vertex {vertex} into schema: {schema}')
+            table_schema = schema['schema']
+            attributes = {_:t for _, t, *_unused_ in table_schema}
+            key = schema['key']
+            if vertex != '':
+                match = f"MATCH (v:{vertex})"
+                conditions = []
+            else:
+                match = f"MATCH (v)"
+                conditions = ["size(labels(v)) = 0"]
+            if schema.get('where') is not None:
+                conditions.append(f"({schema['where']})")
+            returns = f"id(v) AS {key}"
+            for a in attributes:
+                if a != key:
+                    returns += xlate_result_property(a, attributes[a]) # f", v.{a} AS {a}"
+            # Is an empty vertex type if None:
+            if schema['neo4j_schema'] is not None:
+                vertex_copies.append(_Extraction(
+                    vertex, schema['xgt_name'], schema['neo4j_schema'],
+                    match, conditions, returns, 'v'))
+        edge_copies = []
+        for edge, schema_list in xgt_schemas['edges'].items():
+            if self.__verbose:
+                print(f'Copy data for node {edge} into schema: {schema_list}')
+            transform = True if len(schema_list) > 1 else False
+            edge_partitions = (partitions.get(edge, 1)
+                               if isinstance(partitions, dict) else partitions)
+            if (single_pass and transform and edge_partitions == 1 and
+                all(schema['neo4j_schema'] == schema_list[0]['neo4j_schema']
+                    for schema in schema_list)):
+                edge_copies.append(self.__single_pass_edge_extraction(
+                    edge, schema_list))
+                continue
+            for schema in schema_list:
+                name = self.__edge_name_transform(schema['xgt_name'], schema['xgt_source'], schema['xgt_target'], transform)
+                table_schema = schema['schema']
+                attributes = {_:t for _, t, *_unused_ in table_schema}
+                source = schema['source']
+                source_key = schema['source_key']
+                target = schema['target']
+                target_key = schema['target_key']
+                match, conditions = self.__plan_edge_match(
+                    edge, schema['empty_labels'], source, target, counts, labels)
+                if schema.get('where') is not None:
+                    conditions.append(f"({schema['where']})")
+                returns = f"id(u) AS {source_key}"
+                returns += f", id(v) AS {target_key}"
+                for a in attributes:
+                    if a != source_key and a != target_key:
+                        returns += f", e.{a} AS {a}"
+                edge_copies.append(_Extraction(
+                    edge, name, schema['neo4j_schema'], match, conditions,
+                    returns, 'e', (schema['xgt_source'], schema['xgt_target'])))
+        return vertex_copies, edge_copies, estimated_counts
+
+    def __expand_subgraph(self, seeds, hops, rel_types, batch_size):
+        # Follows the relationships of the frontier, the nodes first reached
+        # by the previous hop, in batches of batch_size nodes.
+        rel_pattern = ""
+        if rel_types is not None:
+            rel_pattern = ":" + "|".join(f"`{rel_type}`" for rel_type in rel_types)
+        q = (f"MATCH (u)-[e{rel_pattern}]-(v) WHERE id(u) IN $ids "
+             "RETURN id(e) AS relationship, id(v) AS node")
+        nodes = _IdSet(seeds)
+        relationships = _IdSet()
+        frontier = nodes
+        with self._neo4j_driver.bolt.session(database=self._neo4j_driver._database,
+                                             default_access_mode=neo4j.READ_ACCESS,
+                                             fetch_size=_BOLT_BLOCK_SIZE) as session:
+            for hop in range(hops):
+                reached_nodes = set()
+                reached_relationships = set()
+                for ids in frontier.batches(batch_size):
+                    for record in session.run(q, ids = ids):
+                        if record['relationship'] not in relationships:
+                            reached_relationships.add(record['relationship'])
+                        if record['node'] not in nodes:
+                            reached_nodes.add(record['node'])
+                relationships.update(reached_relationships)
+                nodes.update(reached_nodes)
+                frontier = _IdSet(reached_nodes)
+                if self.__verbose:
+                    print(f"Hop {hop + 1} reached {len(reached_nodes)} nodes "
+                          f"and {len(reached_relationships)} relationships")
+                if len(frontier) == 0:
+                    break
+        return nodes, relationships
+
+    def __subgraph_values(self, q, ids, batch_size):
+        values = [ ]
+        with self._neo4j_driver.bolt.session(database=self._neo4j_driver._database,
+                                             default_access_mode=neo4j.READ_ACCESS) as session:
+            for batch in ids.batches(batch_size):
+                for record in session.run(q, ids = batch):
+                    if record['value'] not in values:
+                        values.append(record['value'])
+        return values
+
+    def __subgraph_copy_data(self, extraction, ids, batch_size, progress_bar):
+        # Copies the rows of the extraction with the given ids, looked up by
+        # id a batch at a time and written to the frame with one writer.
+        query = extraction.query([f"id({extraction.id_variable}) IN $ids"])
+        schema = _arrow_schema(extraction.neo4j_schema)
+        with self._neo4j_driver.bolt.session(database=self._neo4j_driver._database,
+                                             default_access_mode=neo4j.READ_ACCESS,
+                                             fetch_size=_BOLT_BLOCK_SIZE) as session:
+            def batches():
+                for batch in ids.batches(batch_size):
+                    result = session.run(query, ids = batch)
+                    yield from _bolt_batches(result, extraction.neo4j_schema, schema)
+            xgt_writer = self.__arrow_writer(extraction.frame, schema)
+            self.__write_batches(batches(), xgt_writer, progress_bar)
+            xgt_writer.close()
+
+    def __neo4j_schema_labels(self):
+        if self._neo4j_nodes is None:
+            return self.neo4j_node_labels
+        return self.__neo4j_node_labels(False)
+
+    def __edge_plan_patterns(self, edge, match_type, source, target, labels):
+        # The count store patterns telling which endpoint label checks can
+        # be left out of an edge query.
+        patterns = [f"()-[:{edge}]->()"]
+        if match_type in (self._Labels.HAS_BOTH, self._Labels.TARGET_EMPTY):
+            patterns.append(f"(:{source})-[:{edge}]->()")
+        else:
+            patterns += [f"(:{label})-[:{edge}]->()" for label in labels]
+        if match_type in (self._Labels.HAS_BOTH, self._Labels.SOURCE_EMPTY):
+            patterns.append(f"()-[:{edge}]->(:{target})")
+        else:
+            patterns += [f"()-[:{edge}]->(:{label})" for label in labels]
+        return patterns
+
+    def __plan_edge_match(self, edge, match_type, source, target, counts, labels):
+        # Picks the cheapest query for the relationships of edge between
+        # source and target. An endpoint is only checked when the count
+        # store shows some relationships of the type don't match it, so a
+        # type with a single pair of endpoint labels is a plain scan of the
+        # relationship type.
+        total = counts[f"()-[:{edge}]->()"]
+        def endpoint(variable, label, has_label, pattern):
+            if has_label:
+                if counts[pattern.format(f":{label}")] == total:
+                    return f"({variable})", []
+                return f"({variable}:{label})", []
+            if all(counts[pattern.format(f":{other}")] == 0 for other in labels):
+                return f"({variable})", []
+            return f"({variable})", [f"size(labels({variable})) = 0"]
+        has_source = match_type in (self._Labels.HAS_BOTH, self._Labels.TARGET_EMPTY)
+        has_target = match_type in (self._Labels.HAS_BOTH, self._Labels.SOURCE_EMPTY)
+        u, source_conditions = endpoint('u', source, has_source, "({})-[:" + edge + "]->()")
+        v, target_conditions = endpoint('v', target, has_target, "()-[:" + edge + "]->({})")
+        return (f"MATCH {u}-[e:{edge}]->{v}",
+                source_conditions + target_conditions)
+
+    def __explain_extractions(self, extractions, profile):
+        # Runs EXPLAIN, or PROFILE, on each extraction query and reports the
+        # estimated rows and, when profiling, the rows and db hits.
+        def operators(plan):
+            yield plan
+            for child in plan.get('children', []):
+                yield from operators(child)
+        report = []
+        with self._neo4j_driver.bolt.session(database=self._neo4j_driver._database,
+                                             default_access_mode=neo4j.READ_ACCESS) as session:
+            for extraction in extractions:
+                query = extraction.query()
+                summary = session.run(("PROFILE " if profile else "EXPLAIN ") + query).consume()
+                plan = summary.profile if profile else summary.plan
+                plans = list(operators(plan))
+                entry = {'frame' : extraction.frame, 'query' : query,
+                         'operators' : [_['operatorType'] for _ in plans],
+                         'estimated_rows' : plan['args'].get('EstimatedRows'),
+                         'rows' : plan.get('rows'),
+                         'db_hits' : (sum(_.get('dbHits', 0) for _ in plans)
+                                      if profile else None)}
+                report.append(entry)
+                line = (f"{entry['frame']}: estimated rows "
+                        f"{entry['estimated_rows']}")
+                if profile:
+                    line += f", rows {entry['rows']}, db hits {entry['db_hits']}"
+                print(line)
+                print(f"  {query}")
+                print(f"  {' <- '.join(entry['operators'])}")
+        return report
+
+    def __single_pass_vertex_extractions(self, vertex_schemas, partitions):
+        # Labels that share nodes are read together once along with the
+        # labels of each node, routing each row to the frames of its labels.
+        node_type_properties = self._neo4j_node_type_properties
+        if node_type_properties is None:
+            node_type_properties = self.neo4j_node_type_properties
+        groups = { }
+        for node_type in node_type_properties:
+            labels = [label for label in node_type['nodeLabels']
+                      if label in vertex_schemas and
+                         vertex_schemas[label]['neo4j_schema'] is not None and
+                         vertex_schemas[label].get('where') is None and
+                         (partitions.get(label, 1) if isinstance(partitions, dict)
+                          else partitions) == 1]
+            if len(labels) < 2:
+                continue
+            group = set(labels)
+            for label in labels:
+                group |= groups.get(label, set())
+            for label in group:
+                groups[label] = group
+
+        extractions = []
+        for group in {frozenset(group) for group in groups.values()}:
+            group = sorted(group)
+            key = vertex_schemas[group[0]]['key']
+            types = { }
+            for label in group:
+                for name, neo4j_type in vertex_schemas[label]['neo4j_schema']:
+                    types.setdefault(name, set()).add(neo4j_type)
+            # Properties of the labels are read into shared columns, so
+            # labels giving a property different types are read apart.
+            if (any(len(neo4j_types) > 1 for neo4j_types in types.values()) or
+                any(vertex_schemas[label]['key'] != key for label in group)):
+                continue
+            columns = {name : i for i, name in enumerate(types)}
+            neo4j_schema = [[name, *neo4j_types] for name, neo4j_types in types.items()]
+            returns = f"id(v) AS {key}"
+            for name in list(types)[1:]:
+                returns += f", v.{name} AS {name}"
+            returns += ", labels(v) AS xgt_labels"
+            routes = [(vertex_schemas[label]['xgt_name'],
+                       vertex_schemas[label]['neo4j_schema'],
+                       [columns[name] for name, _ in vertex_schemas[label]['neo4j_schema']],
+                       (label,)) for label in group]
+            if self.__verbose:
+                print(f'Copy data for vertices {group} in a single pass')
+            extractions.append(_Extraction(
+                tuple(group), '_'.join(group),
+                neo4j_schema + [['xgt_labels', 'StringArray']], "MATCH (v)",
+                ["(" + " OR ".join(f"v:{label}" for label in group) + ")"],
+                returns, 'v', routes = routes))
+        return extractions
+
+    def __single_pass_edge_extraction(self, edge, schema_list):
+        # Reads the relationship type once along with the labels of its
+        # endpoints, routing each row to the frames of the label pairs.
+        schema = schema_list[0]
+        source_key = schema['source_key']
+        target_key = schema['target_key']
+        returns = f"id(u) AS {source_key}, id(v) AS {target_key}"
+        for a, *_unused_ in schema['schema']:
+            if a != source_key and a != target_key:
+                returns += f", e.{a} AS {a}"
+        returns += ", labels(u) AS xgt_source_labels, labels(v) AS xgt_target_labels"
+        neo4j_schema = list(schema['neo4j_schema']) + [
+            ['xgt_source_labels', 'StringArray'],
+            ['xgt_target_labels', 'StringArray']]
+        columns = list(range(len(schema['neo4j_schema'])))
+
+        routes = []
+        endpoints = []
+        for schema in schema_list:
+            match_type = schema['empty_labels']
+            source = (None if match_type in (self._Labels.BOTH_EMPTY, self._Labels.SOURCE_EMPTY)
+                      else schema['source'])
+            target = (None if match_type in (self._Labels.BOTH_EMPTY, self._Labels.TARGET_EMPTY)
+                      else schema['target'])
+            frame = self.__edge_name_transform(schema['xgt_name'], schema['xgt_source'],
+                                               schema['xgt_target'], True)
+            routes.append((frame, schema['neo4j_schema'], columns, (source, target)))
+            endpoints += [schema['xgt_source'], schema['xgt_target']]
+        conditions = []
+        if schema.get('where') is not None:
+            conditions.append(f"({schema['where']})")
+        return _Extraction(edge, edge, neo4j_schema, f"MATCH (u)-[e:{edge}]->(v)",
+                           conditions, returns, 'e', tuple(endpoints), routes)
+
+    def __routed_copy_data(self, extraction, progress_bar):
+        with self._neo4j_driver.bolt.session(database=self._neo4j_driver._database,
+                                             default_access_mode=neo4j.READ_ACCESS,
+                                             fetch_size=_BOLT_BLOCK_SIZE) as session:
+            schema = _arrow_schema(extraction.neo4j_schema)
+            result = session.run(extraction.query())
+            xgt_writer = _RoutedWriter(
+                extraction.routes,
+                [self.__arrow_writer(frame, _arrow_schema(neo4j_schema))
+                 for frame, neo4j_schema, *_ in extraction.routes])
+            self.__write_batches(_bolt_batches(result, extraction.neo4j_schema, schema),
+                                 xgt_writer, progress_bar)
+            xgt_writer.close()
+
+    def __copy_extraction(self, extraction, partitions, progress_bar):
+        if isinstance(partitions, dict):
+            partitions = partitions.get(extraction.name, 1)
+        if partitions > 1:
+            self.__partitioned_copy_data(extraction, partitions, progress_bar)
+        else:
+            self.__copy_data(extraction.query(), extraction.frame,
+                             extraction.neo4j_schema, progress_bar)
+
+    def __paged_copy_data(self, extraction, page_size, state, resume, progress_bar):
+        key = self.__checkpoint_key(extraction.frame)
+        last = -1
+        if state is not None and resume:
+            checkpoint = state.get(key, {'last' : -1, 'done' : False})
+            if checkpoint['done']:
+                return
+            last = checkpoint['last']
+            # Each page is recorded as pending before it is written. If the
+            # frame holds its rows, the transfer stopped after the page was
+            # committed but before its checkpoint, so it isn't copied again.
+            if ('pending' in checkpoint and
+                self._xgt_server.get_frame(extraction.frame).num_rows >= checkpoint['rows']):
+                last = checkpoint['pending']
+        # A vertex page with rows skipped as duplicates falls short of the
+        # row count, so the first page after resuming skips rows already in
+        # the vertex frame.
+        on_duplicate_keys = None
+        if last >= 0 and extraction.id_variable == 'v':
+            on_duplicate_keys = 'skip'
+
+        id_expression = f"id({extraction.id_variable})"
+        query = extraction.query(
+            [f"{id_expression} > $last"],
+            returns = f"{extraction.returns}, {id_expression} AS xgt_page_id")
+        query += " ORDER BY xgt_page_id LIMIT $page_size"
+        schema = _arrow_schema(extraction.neo4j_schema)
+        converters = _bolt_converters(extraction.neo4j_schema)
+
+        def read_page(tx, last):
+            return list(tx.run(query, last = last, page_size = page_size))
+
+        with self._neo4j_driver.bolt.session(database=self._neo4j_driver._database,
+                                             default_access_mode=neo4j.READ_ACCESS,
+                                             fetch_size=_BOLT_BLOCK_SIZE) as session:
+            # Read transactions are retried by the driver on transient
+            # errors such as leader switches.
+            execute_read = getattr(session, 'execute_read', None)
+            if execute_read is None:
+                execute_read = session.read_transaction
+            while True:
+                records = execute_read(read_page, last)
+                if len(records) == 0:
+                    break
+                if state is not None:
+                    rows = self._xgt_server.get_frame(extraction.frame).num_rows
+                    state.set(key, {'last' : last,
+                                    'pending' : records[-1]['xgt_page_id'],
+                                    'rows' : rows + len(records), 'done' : False})
+                xgt_writer = self.__arrow_writer(extraction.frame, schema,
+                                                 on_duplicate_keys)
+                for start in range(0, len(records), _BOLT_BLOCK_SIZE):
+                    xgt_writer.write(_bolt_batch(
+                        records[start:start + _BOLT_BLOCK_SIZE], converters,
+                        schema))
+                xgt_writer.close()
+                progress_bar.show_progress(len(records))
+                on_duplicate_keys = None
+                last = records[-1]['xgt_page_id']
+                if len(records) < page_size:
+                    break
+                if state is not None:
+                    state.set(key, {'last' : last, 'done' : False})
+        if state is not None:
+            state.set(key, {'last' : last, 'done' : True})
+
+    def __watermark_copy_data(self, extraction, watermark, state, progress_bar):
+        # Copies the rows with a watermark above the one saved for the frame.
+        # Each row is returned with its watermark and the largest one copied
+        # is saved, so rows changing during the copy are copied again by the
+        # next transfer.
+        key = self.__checkpoint_key(extraction.frame)
+        last = state.get(key)
+        expression = f"{extraction.id_variable}.{watermark}"
+        conditions = []
+        parameters = { }
+        if last is not None:
+            function = _WATERMARK_FUNCTIONS.get(last['type'], '')
+            conditions.append(f"{expression} > {function}($xgt_watermark)")
+            parameters['xgt_watermark'] = last['value']
+        query = extraction.query(
+            conditions,
+            returns = f"{extraction.returns}, {expression} AS xgt_watermark")
+        schema = _arrow_schema(extraction.neo4j_schema)
+        converters = _bolt_converters(extraction.neo4j_schema)
+        column = len(extraction.neo4j_schema)
+        high = None
+
+        def batches(result):
+            nonlocal high
+            while True:
+                records = _fetch_records(result, _BOLT_BLOCK_SIZE)
+                if len(records) == 0:
+                    return
+                for record in records:
+                    value = record[column]
+                    if value is not None and (high is None or value > high):
+                        high = value
+                yield _bolt_batch(records, converters, schema)
+
+        staging = None
+        if extraction.id_variable == 'v':
+            # Nodes already in the vertex frame are skipped and updated from
+            # a staging table after the copy.
+            staging = self.__watermark_staging(extraction.frame)
+        try:
+            with self._neo4j_driver.bolt.session(database=self._neo4j_driver._database,
+                                                 default_access_mode=neo4j.READ_ACCESS,
+                                                 fetch_size=_BOLT_BLOCK_SIZE) as session:
+                result = session.run(query, parameters)
+                if staging is None:
+                    xgt_writer = self.__arrow_writer(extraction.frame, schema)
+                else:
+                    xgt_writer = _TeeWriter(
+                        [self.__arrow_writer(extraction.frame, schema, 'skip'),
+                         self.__arrow_writer(staging, schema)])
+                self.__write_batches(batches(result), xgt_writer, progress_bar)
+                xgt_writer.close()
+            if staging is not None and high is not None:
+                self.__update_watermark_vertices(extraction.frame, staging)
+        finally:
+            if staging is not None:
+                self._xgt_server.drop_frame(staging)
+        if high is not None:
+            state.set(key, _watermark_state(high))
+
+    def __check_watermark_edges(self, xgt_schemas, insert_only):
+        if not insert_only and len(xgt_schemas['edges']) > 0:
+            raise ValueError("Incremental transfers of relationship types "
+                             "require watermark_insert_only, as changed "
+                             "relationships would be copied again.")
+
+    def __watermark_staging(self, frame):
+        # A table with the schema of the vertex frame holding its changed rows.
+        staging = f"xgt_watermark_{frame}"
+        self._xgt_server.drop_frame(staging)
+        self._xgt_server.create_table_frame(
+            name = staging, schema = self._xgt_server.get_frame(frame).schema,
+            attempts = 5)
+        return staging
+
+    def __update_watermark_vertices(self, frame, staging):
+        vertex_frame = self._xgt_server.get_frame(frame)
+        key = vertex_frame.key
+        columns = [column[0] for column in vertex_frame.schema
+                   if column[0] != key]
+        if len(columns) == 0:
+            return
+        # Each staged row looks up its vertex by key, rather than joining
+        # the staging table to the whole vertex frame.
+        updates = ", ".join(f"v.{column} = t.{column}" for column in columns)
+        self._xgt_server.run_job(f"MATCH (t:{staging}) "
+                                 f"MATCH (v:{frame} {{{key}: t.{key}}}) SET {updates}")
+
+    def __checkpoint_key(self, frame):
+        database = self._neo4j_driver._database
+        return f"{'' if database is None else database}/{self._default_namespace}__{frame}"
+
+    def __partitioned_copy_data(self, extraction, partitions, progress_bar):
+        settings = getattr(self._neo4j_driver, '_bolt_settings', None)
+        if settings is None:
+            raise ValueError("Partitioned transfers require a Neo4jDriver "
+                             "created from a host.")
+        if (self._neo4j_driver._py2neo_driver is not None or
+            self._neo4j_driver._arrow_driver is not None):
+            raise ValueError("Partitioned transfers require the neo4j-bolt driver.")
+
+        id_expression = f"id({extraction.id_variable})"
+        bounds_query = extraction.query(
+            returns = f"min({id_expression}), max({id_expression})")
+        low = high = None
+        with self._neo4j_driver.query(bounds_query, False, True) as query:
+            for record in query.result():
+                low, high = record[0], record[1]
+        if low is None:
+            return
+
+        step = (high - low) // partitions + 1
+        ranges = [(start, start + step)
+                  for start in range(low, high + 1, step)]
+        query = extraction.query(
+            [f"{id_expression} >= $low", f"{id_expression} < $high"])
+        schema = _arrow_schema(extraction.neo4j_schema)
+
+        # Workers are spawned rather than forked since this process may hold
+        # open driver connections and threads.
+        context = multiprocessing.get_context('spawn')
+        batches = context.Queue(2 * len(ranges))
+        workers = [context.Process(target = _copy_partition,
+                                   args = (settings, query,
+                                           {'low' : start, 'high' : end},
+                                           extraction.neo4j_schema, batches))
+                   for start, end in ranges]
+        for worker in workers:
+            worker.start()
+        try:
+            xgt_writer = self.__arrow_writer(extraction.frame, schema)
+            remaining = len(workers)
+            while remaining > 0:
+                try:
+                    kind, value = batches.get(timeout = 1)
+                except queue.Empty:
+                    for worker in workers:
+                        if worker.exitcode not in (None, 0):
+                            raise RuntimeError(
+                                f"Worker extracting {extraction.name} exited "
+                                f"with code {worker.exitcode}.")
+                    continue
+                if kind == 'batch':
+                    batch = pa.ipc.read_record_batch(value, schema)
+                    xgt_writer.write(batch)
+                    progress_bar.show_progress(batch.num_rows)
+                elif kind == 'error':
+                    raise RuntimeError(
+                        f"Worker extracting {extraction.name} failed:\n{value}")
+                else:
+                    remaining -= 1
+            xgt_writer.close()
+        finally:
+            for worker in workers:
+                if worker.is_alive():
+                    worker.terminate()
+                worker.join()
+
     def __copy_data(self, cypher_for_extract, frame, neo4j_schema, progress_bar):
         if self._neo4j_driver._py2neo_driver is not None:
             self.__py2neo_copy_data(cypher_for_extract, neo4j_schema, frame, progress_bar)
@@ -1351,40 +2957,77 @@ class Neo4jConnector(object):
 
     def __bolt_copy_data(self, cypher_for_extract, neo4j_schema, frame, progress_bar):
         with self._neo4j_driver.bolt.session(database=self._neo4j_driver._database,
-                                             default_access_mode=neo4j.READ_ACCESS) as session:
-            schema = pa.schema([])
+                                             default_access_mode=neo4j.READ_ACCESS,
+                                             fetch_size=_BOLT_BLOCK_SIZE) as session:
             # With xGT 10.1 we need to change double to float
             # so we infer the schema manually.
-            for i, value in enumerate(neo4j_schema):
-                arrow_type = self._NEO4J_TYPE_TO_ARROW_TYPE[value[1]]
-                schema = schema.append(pa.field('col' + str(i), arrow_type))
-
+            schema = _arrow_schema(neo4j_schema)
             result = session.run(cypher_for_extract)
-            first_record = result.peek()
-            data = [None] * len(first_record)
+            xgt_writer = self.__arrow_writer(frame, schema)
+            self.__write_batches(_bolt_batches(result, neo4j_schema, schema),
+                                 xgt_writer, progress_bar)
+            xgt_writer.close()
 
-            block_size = 10000
-            for i in range(len(first_record)):
-                data[i] = [None] * block_size
+    def __check_async_driver(self):
+        if (self._neo4j_driver._py2neo_driver is not None or
+            self._neo4j_driver._arrow_driver is not None):
+            raise ValueError("Async transfers require the neo4j-bolt driver.")
+        if getattr(self._neo4j_driver, '_bolt_settings', None) is None:
+            raise ValueError("Async transfers require a Neo4jDriver created from a host.")
+
+    async def __async_bolt_copy_data(self, driver, extraction, progress_bar):
+        loop = asyncio.get_running_loop()
+        schema = _arrow_schema(extraction.neo4j_schema)
+        converters = _bolt_converters(extraction.neo4j_schema)
+        async with driver.session(database=self._neo4j_driver._database,
+                                  default_access_mode=neo4j.READ_ACCESS,
+                                  fetch_size=_BOLT_BLOCK_SIZE) as session:
+            result = await session.run(extraction.query())
+            xgt_writer = await loop.run_in_executor(
+                None, self.__arrow_writer, extraction.frame, schema)
+            def write(records):
+                batch = _bolt_batch(records, converters, schema)
+                xgt_writer.write(batch)
+                progress_bar.show_progress(batch.num_rows)
+            # The next block is read from Neo4j while the last is written.
+            writing = None
+            async for records in _async_record_blocks(result):
+                if writing is not None:
+                    await writing
+                writing = loop.run_in_executor(None, write, records)
+            if writing is not None:
+                await writing
+            await loop.run_in_executor(None, xgt_writer.close)
 
-            xgt_writer = self.__arrow_writer(frame, schema)
+    def __py2neo_copy_data(self, cypher_for_extract, neo4j_schema, frame, progress_bar):
+        # With xGT 10.1 we need to change double to float
+        # so we infer the schema manually.
+        schema = _arrow_schema(neo4j_schema)
+
+        result = self._neo4j_driver._py2neo_driver.query(cypher_for_extract)
+        block_size = _BOLT_BLOCK_SIZE
+
+        # Types Used by py2neo
+        from interchange.time import Date, Time, DateTime, Duration
+        def convert_duration(val):
+            return (val.months * 2628288 + val.days * 86400 +
+                    val.seconds) * 10**9 + int(val.subseconds * 10**9)
+        def py2neo_batches():
+            data = [None] * len(result.keys())
+            for i in range(len(result.keys())):
+                data[i] = [None] * block_size
             chunk_count = 0
-            def convert_duration(val):
-                return (val.months * 2628288 + val.days * 86400 +
-                        val.seconds) * 10**9 + val.nanoseconds
             for record in result:
                 for i, val in enumerate(record):
-                    if isinstance(val, (neo4j.time.Date, neo4j.time.Time,
-                                        neo4j.time.DateTime)):
+                    if isinstance(val, (Date, Time, DateTime)):
                         data[i][chunk_count] = val.to_native()
-                    elif isinstance(val, neo4j.time.Duration):
+                    elif isinstance(val, Duration):
                         # For months this average seconds in a month.
                         data[i][chunk_count] = convert_duration(val)
                     elif isinstance(val, list):
-                        if isinstance(val[0], (neo4j.time.Date, neo4j.time.Time,
-                                               neo4j.time.DateTime)):
+                        if isinstance(val[0], (Date, Time, DateTime)):
                             data[i][chunk_count] = [x.to_native() for x in val]
-                        elif isinstance(val[0], neo4j.time.Duration):
+                        elif isinstance(val[0], Duration):
                             data[i][chunk_count] = [convert_duration(x) for x in val]
                         else:
                             data[i][chunk_count] = val
@@ -1392,72 +3035,17 @@ class Neo4jConnector(object):
                         data[i][chunk_count] = val
                 chunk_count = chunk_count + 1
                 if chunk_count == block_size:
-                    batch = pa.RecordBatch.from_arrays(data, schema=schema)
-                    xgt_writer.write(batch)
-                    progress_bar.show_progress(chunk_count)
+                    yield pa.RecordBatch.from_arrays(data, schema=schema)
+                    # from_arrays copies the values, so the lists are reused.
                     chunk_count = 0
 
             if chunk_count > 0:
                 for j in range(len(data)):
                     data[j] = data[j][:-(block_size - chunk_count)]
-                batch = pa.RecordBatch.from_arrays(data, schema=schema)
-                xgt_writer.write(batch)
-                progress_bar.show_progress(chunk_count)
-
-            xgt_writer.close()
-
-    def __py2neo_copy_data(self, cypher_for_extract, neo4j_schema, frame, progress_bar):
-        schema = pa.schema([])
-        # With xGT 10.1 we need to change double to float
-        # so we infer the schema manually.
-        for i, value in enumerate(neo4j_schema):
-            arrow_type = self._NEO4J_TYPE_TO_ARROW_TYPE[value[1]]
-            schema = schema.append(pa.field('col' + str(i), arrow_type))
-
-        result = self._neo4j_driver._py2neo_driver.query(cypher_for_extract)
-        data = [None] * len(result.keys())
-
-        block_size = 10000
-        for i in range(len(result.keys())):
-            data[i] = [None] * block_size
+                yield pa.RecordBatch.from_arrays(data, schema=schema)
 
         xgt_writer = self.__arrow_writer(frame, schema)
-        chunk_count = 0
-        # Types Used by py2neo
-        from interchange.time import Date, Time, DateTime, Duration
-        def convert_duration(val):
-            return (val.months * 2628288 + val.days * 86400 +
-                    val.seconds) * 10**9 + int(val.subseconds * 10**9)
-        for record in result:
-            for i, val in enumerate(record):
-                if isinstance(val, (Date, Time, DateTime)):
-                    data[i][chunk_count] = val.to_native()
-                elif isinstance(val, Duration):
-                    # For months this average seconds in a month.
-                    data[i][chunk_count] = convert_duration(val)
-                elif isinstance(val, list):
-                    if isinstance(val[0], (Date, Time, DateTime)):
-                        data[i][chunk_count] = [x.to_native() for x in val]
-                    elif isinstance(val[0], Duration):
-                        data[i][chunk_count] = [convert_duration(x) for x in val]
-                    else:
-                        data[i][chunk_count] = val
-                else:
-                    data[i][chunk_count] = val
-            chunk_count = chunk_count + 1
-            if chunk_count == block_size:
-                batch = pa.RecordBatch.from_arrays(data, schema=schema)
-                xgt_writer.write(batch)
-                progress_bar.show_progress(chunk_count)
-                chunk_count = 0
-
-        if chunk_count > 0:
-            for j in range(len(data)):
-                data[j] = data[j][:-(block_size - chunk_count)]
-            batch = pa.RecordBatch.from_arrays(data, schema=schema)
-            xgt_writer.write(batch)
-            progress_bar.show_progress(chunk_count)
-
+        self.__write_batches(py2neo_batches(), xgt_writer, progress_bar)
         xgt_writer.close()
 
     def __arrow_copy_data(self, cypher_for_extract, frame, progress_bar):
@@ -1469,14 +3057,58 @@ class Neo4jConnector(object):
         neo4j_reader = self._neo4j_driver._arrow_driver.stream(ticket).to_reader()
         xgt_writer = self.__arrow_writer(frame, neo4j_reader.schema)
         # move data from Neo4j to xGT in chunks
-        while (True):
+        def arrow_batches():
+            while (True):
+                try:
+                    yield neo4j_reader.read_next_batch()
+                except StopIteration:
+                    break
+        self.__write_batches(arrow_batches(), xgt_writer, progress_bar)
+        xgt_writer.close()
+
+    def __write_batches(self, batches, xgt_writer, progress_bar):
+        prefetch = getattr(self._neo4j_driver, '_prefetch_batches', 0)
+        if prefetch <= 0:
+            for batch in batches:
+                xgt_writer.write(batch)
+                progress_bar.show_progress(batch.num_rows)
+            return
+
+        # Read and convert batches on another thread while this one writes
+        # them to xGT, so the two network transfers overlap.
+        pending = queue.Queue(prefetch)
+        stop = threading.Event()
+        def put(item):
+            while not stop.is_set():
+                try:
+                    pending.put(item, timeout = 0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+        def read_batches():
             try:
-                batch = neo4j_reader.read_next_batch()
+                for batch in batches:
+                    if not put(batch):
+                        return
+                put(None)
+            except BaseException as e:
+                put(e)
+
+        reader = threading.Thread(target = read_batches, daemon = True)
+        reader.start()
+        try:
+            while True:
+                batch = pending.get()
+                if batch is None:
+                    break
+                if isinstance(batch, BaseException):
+                    raise batch
                 xgt_writer.write(batch)
                 progress_bar.show_progress(batch.num_rows)
-            except StopIteration:
-                break
-        xgt_writer.close()
+        finally:
+            stop.set()
+            reader.join()
 
     def __neo4j_relationship_types(self, flush_cache = True) -> list():
         if flush_cache:
@@ -1506,18 +3138,16 @@ class Neo4jConnector(object):
     def __xgt_unlabeled_vertex_name(self):
         return 'unlabeled'
 
-    # TODO(landwehrj) : Is there a way to detect the cache is stale
-    # One option is to use the Neo4j count store of relationship/nodes
-    # to check if there are changes there. This wouldn't work in certain
-    # cases. Is there a way to get database modification time?
-    # Is it possible to query individual schema elements?
     def __update_cache_state(self):
+        if self.__refresh_snapshot():
+            return
         self._neo4j_relationship_types = None
         self._neo4j_node_type_properties = None
         self._neo4j_rel_type_properties = None
         self._neo4j_property_keys = None
         self._neo4j_node_labels = None
         self._neo4j_nodes = None
+        self._neo4j_counts = { }
         n = self.neo4j_node_type_properties
         self._neo4j_nodes = self.__neo4j_process_nodes(n)
         e = self.neo4j_rel_type_properties
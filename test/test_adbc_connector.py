@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*- --------------------------------------------------===#
+#
+#  Copyright 2022-2023 Trovares Inc.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+#
+#===----------------------------------------------------------------------===#
+
+import os
+import tempfile
+import threading
+import unittest
+from parameterized import parameterized_class
+import xgt
+from xgt_connector import ODBCConnector, ADBCDriver
+
+@parameterized_class([
+   { "driver": "adbc_driver_sqlite", "file_name": "test.db" },
+   { "driver": "adbc_driver_duckdb", "file_name": "test.duckdb" },
+])
+class TestXgtADBCConnector(unittest.TestCase):
+  # Print all diffs on failure.
+  maxDiff=None
+  @classmethod
+  def setup_class(cls):
+    # Create a connection to Rocketgraph xGT
+    cls.xgt = xgt.Connection()
+    try:
+      cls.xgt.create_namespace('test')
+    except:
+      pass
+    cls.xgt.set_default_namespace('test')
+    cls.directory = tempfile.TemporaryDirectory()
+    cls.adbc_driver = ADBCDriver(cls.driver, os.path.join(cls.directory.name, cls.file_name))
+    cls.conn = ODBCConnector(cls.xgt, cls.adbc_driver)
+    return
+
+  @classmethod
+  def teardown_class(cls):
+    del cls.conn
+    cls.directory.cleanup()
+    cls.xgt.drop_namespace('test', force_drop = True)
+    del cls.xgt
+
+  def setup_method(self, method):
+    self._erase_database()
+
+  def teardown_method(self, method):
+    self._erase_database()
+
+  def _erase_database(self):
+    for table in ['test', 'Vertex', 'Edge', 'results']:
+      self.adbc_driver._execute(f"DROP TABLE IF EXISTS {table}")
+    self.xgt.drop_namespace('test', force_drop = True)
+
+  def _query(self, query):
+    return [list(row.values()) for batch in self.adbc_driver._read_arrow_batches(query, 1000)
+            for row in batch.to_pylist()]
+
+  def test_transfer(self):
+    self.adbc_driver._execute("CREATE TABLE test (Value1 INTEGER, Value2 INTEGER, Value3 VARCHAR(255))")
+    self.adbc_driver._execute("INSERT INTO test VALUES (0, 0, 'hola'), (1, 0, 'adios'), (NULL, NULL, NULL)")
+
+    self.conn.transfer_to_xgt(tables = ['test'])
+    assert self.xgt.get_frame('test').num_rows == 3
+
+  def test_vertex_and_edge(self):
+    self.adbc_driver._execute("CREATE TABLE test (Value1 INTEGER, Value2 INTEGER, Value3 VARCHAR(255))")
+    self.adbc_driver._execute("INSERT INTO test VALUES (0, 0, 'hola'), (1, 0, 'adios')")
+
+    self.conn.transfer_to_xgt(tables = [('test', 'Vertex', (0,))])
+    self.conn.transfer_to_xgt(tables = [('test', 'Edge', ('Vertex', 'Vertex', 0, 1))])
+    assert self.xgt.get_frame('Vertex').num_rows == 2
+    assert self.xgt.get_frame('Edge').num_rows == 2
+
+  def test_transfer_query(self):
+    self.adbc_driver._execute("CREATE TABLE test (Value1 INTEGER, Value2 INTEGER, Value3 VARCHAR(255))")
+    self.adbc_driver._execute("INSERT INTO test VALUES (0, 0, 'hola'), (1, 0, 'adios')")
+
+    row_count, _ = self.conn.transfer_query_to_xgt("SELECT Value1, Value3 FROM test", mapping = ('test', (0,)), batch_size = 1)
+    assert row_count == 2
+    self.assertCountEqual(self.xgt.get_frame('test').get_data(), [[0, 'hola'], [1, 'adios']])
+
+  def test_transfer_to_adbc(self):
+    self.adbc_driver._execute("CREATE TABLE test (Value1 INTEGER PRIMARY KEY, Value2 INTEGER, Value3 VARCHAR(255))")
+    self.adbc_driver._execute("INSERT INTO test VALUES (0, 0, 'hola'), (1, 0, 'adios')")
+
+    self.conn.transfer_to_xgt(tables = [('test', (0,))])
+    self.adbc_driver._execute("DELETE FROM test")
+    self.conn.transfer_to_odbc(vertices = ['test'])
+    self.assertCountEqual(self._query("SELECT * FROM test"), [[0, 0, 'hola'], [1, 0, 'adios']])
+
+    self.adbc_driver._execute("UPDATE test SET Value3 = 'old'")
+    self.conn.transfer_to_odbc(vertices = ['test'], upsert = True)
+    self.assertCountEqual(self._query("SELECT * FROM test"), [[0, 0, 'hola'], [1, 0, 'adios']])
+
+  def test_transfer_query_aggregate(self):
+    self.adbc_driver._execute("CREATE TABLE test (Value1 INTEGER, Value2 INTEGER, Value3 VARCHAR(255))")
+    self.adbc_driver._execute("INSERT INTO test VALUES (0, 0, 'hola'), (1, 0, 'adios'), (2, 1, 'hola')")
+
+    row_count, _ = self.conn.transfer_query_to_xgt("SELECT Value3, COUNT(*) AS Total FROM test GROUP BY Value3;",
+                                                   mapping = ('test', (0,)))
+    assert row_count == 2
+    self.assertCountEqual(self.xgt.get_frame('test').get_data(), [['hola', 2], ['adios', 1]])
+
+  def test_transfer_to_adbc_create_tables(self):
+    self.adbc_driver._execute("CREATE TABLE test (Value1 INTEGER, Value2 INTEGER, Value3 VARCHAR(255))")
+    self.adbc_driver._execute("INSERT INTO test VALUES (0, 0, 'hola'), (1, 0, 'adios')")
+    self.conn.transfer_to_xgt(tables = [('test', 'Vertex', (2,))])
+    self.conn.transfer_to_xgt(tables = [('test', 'Edge', ('Vertex', 'Vertex', 2, 2))])
+
+    self.conn.transfer_to_odbc(vertices = ['Vertex'], edges = ['Edge'], create_tables = True)
+    self.assertCountEqual(self._query("SELECT * FROM Vertex"), [[0, 0, 'hola'], [1, 0, 'adios']])
+    self.assertCountEqual(self._query("SELECT * FROM Edge"), [[0, 0, 'hola'], [1, 0, 'adios']])
+
+    # The vertex keys are unique after the transfer.
+    self.conn.transfer_to_odbc(vertices = ['Vertex'], upsert = True)
+    self.assertCountEqual(self._query("SELECT * FROM Vertex"), [[0, 0, 'hola'], [1, 0, 'adios']])
+
+  def test_transfer_with_limits(self):
+    self.adbc_driver._execute("CREATE TABLE test (Value1 INTEGER, Value2 INTEGER, Value3 VARCHAR(255))")
+    self.adbc_driver._execute("INSERT INTO test VALUES (0, 0, 'hola'), (1, 0, 'adios'), (2, 1, 'hola')")
+
+    wait_time = self.adbc_driver.throttle_wait_time
+    self.adbc_driver.set_limits(max_rows_per_second = 4, max_connections = 1)
+    try:
+      self.conn.transfer_to_xgt(tables = ['test'], batch_size = 1)
+    finally:
+      self.adbc_driver.set_limits()
+    assert self.xgt.get_frame('test').num_rows == 3
+    assert self.adbc_driver.throttle_wait_time - wait_time > 0.5
+
+  def test_transfer_sample(self):
+    self.adbc_driver._execute("CREATE TABLE test (Value1 INTEGER, Value2 INTEGER, Value3 VARCHAR(255))")
+    values = ', '.join(f"({i}, {(i * 7) % 100}, 'hola')" for i in range(100))
+    self.adbc_driver._execute(f"INSERT INTO test VALUES {values}")
+
+    self.conn.transfer_to_xgt(tables = [('test', 'Vertex', (0,))], sample = 10)
+    assert self.xgt.get_frame('Vertex').num_rows == 10
+
+    self.conn.transfer_to_xgt(tables = [('test', 'Vertex', (0,))], sample = 0.5)
+    vertices = self.xgt.get_frame('Vertex').num_rows
+    assert 0 < vertices < 100
+    self.conn.transfer_to_xgt(tables = [('test', 'Edge', ('Vertex', 'Vertex', 0, 1))], append = True, sample = 0.5)
+    if self.driver != 'adbc_driver_sqlite':
+      # The sampled edges only connect sampled vertices, so no vertices are added.
+      assert self.xgt.get_frame('Vertex').num_rows == vertices
+
+    with self.assertRaises(ValueError):
+      self.conn.transfer_to_xgt(tables = ['test'], sample = 0)
+
+    # A sample the driver can't take fails before the frames are recreated.
+    driver = ADBCDriver(self.driver, os.path.join(self.directory.name, self.file_name))
+    driver._hash_expression = None
+    driver._random_expression = None
+    conn = ODBCConnector(self.xgt, driver)
+    vertices = self.xgt.get_frame('Vertex').num_rows
+    with self.assertRaises(xgt.XgtNotImplemented):
+      conn.transfer_to_xgt(tables = [('test', 'Vertex', (0,))], sample = 0.5)
+    with self.assertRaises(xgt.XgtNotImplemented):
+      conn.transfer_query_to_xgt("SELECT * FROM test", mapping = ('Vertex', (0,)), sample = 0.5)
+    assert self.xgt.get_frame('Vertex').num_rows == vertices
+
+  def test_transfer_job_to_adbc(self):
+    self.adbc_driver._execute("CREATE TABLE test (Value1 INTEGER, Value2 INTEGER, Value3 VARCHAR(255))")
+    self.adbc_driver._execute("INSERT INTO test VALUES (0, 0, 'hola'), (1, 0, 'adios')")
+    self.conn.transfer_to_xgt(tables = [('test', 'Vertex', (0,))])
+    self.adbc_driver._execute("CREATE TABLE results (Name VARCHAR(255), Id BIGINT, Score DOUBLE PRECISION)")
+    # SQLite only reports the column types of a table with rows.
+    self.adbc_driver._execute("INSERT INTO results VALUES ('seed', -1, 0.5)")
+
+    row_count = self.conn.transfer_job_to_odbc("MATCH (v:Vertex) RETURN v.Value3, v.Value1", 'results')
+    assert row_count == 2
+    self.assertCountEqual(self._query("SELECT * FROM results"),
+                          [['seed', -1, 0.5], ['hola', 0, None], ['adios', 1, None]])
+
+    # Upserting a score by id leaves the unmapped names unchanged.
+    self.adbc_driver._execute("CREATE UNIQUE INDEX results_key ON results (Id)")
+    job = self.xgt.run_job("MATCH (v:Vertex) RETURN v.Value1 AS id, v.Value2 * 2.0 + 1.0 AS value")
+    self.conn.transfer_job_to_odbc(job, 'results', column_mapping = {'id' : 'Id', 'value' : 'Score'},
+                                   upsert = True, upsert_keys = ['Id'])
+    self.assertCountEqual(self._query("SELECT * FROM results"),
+                          [['seed', -1, 0.5], ['hola', 0, 1.0], ['adios', 1, 1.0]])
+
+    with self.assertRaises(ValueError):
+      self.conn.transfer_job_to_odbc(job, 'results', column_mapping = {'missing' : 'Id'})
+
+  def test_concurrent_transfers(self):
+    self.adbc_driver._execute("CREATE TABLE test (Value1 INTEGER, Value2 INTEGER, Value3 VARCHAR(255))")
+    values = ', '.join(f"({i}, {(i * 7) % 1000}, 'hola')" for i in range(1000))
+    self.adbc_driver._execute(f"INSERT INTO test VALUES {values}")
+    errors = []
+
+    def transfer(i):
+      try:
+        for _ in range(3):
+          self.conn.transfer_to_xgt(tables = [('test', f'Vertex{i}', (0,)),
+                                              ('test', f'Edge{i}', (f'Vertex{i}', f'Vertex{i}', 0, 1))],
+                                    batch_size = 100)
+          self.conn.transfer_query_to_xgt("SELECT Value1, Value3 FROM test WHERE Value2 < 500",
+                                          mapping = (f'Query{i}', (0,)), batch_size = 100)
+      except Exception as e:
+        errors.append(e)
+
+    threads = [threading.Thread(target = transfer, args = (i,)) for i in range(8)]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    assert errors == []
+    for i in range(8):
+      assert self.xgt.get_frame(f'Vertex{i}').num_rows == 1000
+      assert self.xgt.get_frame(f'Edge{i}').num_rows == 1000
+      assert self.xgt.get_frame(f'Query{i}').num_rows == 500
@@ -17,13 +17,19 @@
 #
 #===----------------------------------------------------------------------===#
 
+import asyncio
+import json
+import os
+import tempfile
 import unittest
+from unittest import mock
 from parameterized import parameterized_class
 import time
 
 import neo4j
 import xgt
 from xgt_connector import Neo4jConnector, Neo4jDriver
+from xgt_connector.common import _JSONState
 
 @parameterized_class([
    { "driver": "neo4j" },
@@ -383,6 +389,164 @@ class TestXgtNeo4jConnector(unittest.TestCase):
     assert edge_frame.num_rows == 3
     self.xgt.drop_frame("Relationship")
 
+  def test_transfer_everything_concurrent(self):
+    self._populate_relationship_working_types_bolt()
+    self.neo4j_driver.query(
+        'CREATE (:Other{x: 1})-[:Link]->(:Node{int: 5})').finalize()
+    driver = Neo4jDriver(auth=('neo4j', 'foo'), max_workers=4,
+                         max_connection_pool_size=8)
+    c = Neo4jConnector(self.xgt, driver)
+    c.transfer_to_xgt()
+    assert self.xgt.get_frame('Node').num_rows == 7
+    assert self.xgt.get_frame('Other').num_rows == 1
+    assert self.xgt.get_frame('Relationship').num_rows == 3
+    assert self.xgt.get_frame('Link').num_rows == 1
+    driver.bolt.close()
+    self.xgt.drop_frame("Relationship")
+    self.xgt.drop_frame("Link")
+
+  def test_transfer_async(self):
+    self._populate_relationship_working_types_bolt()
+    self.neo4j_driver.query(
+        'CREATE (:Other{x: 1})-[:Link]->(:Node{int: 5})').finalize()
+    driver = Neo4jDriver(auth=('neo4j', 'foo'), max_workers=2)
+    c = Neo4jConnector(self.xgt, driver)
+    async def transfer():
+      await c.async_transfer_to_xgt()
+    asyncio.run(transfer())
+    assert self.xgt.get_frame('Node').num_rows == 7
+    assert self.xgt.get_frame('Other').num_rows == 1
+    assert self.xgt.get_frame('Relationship').num_rows == 3
+    assert self.xgt.get_frame('Link').num_rows == 1
+    with self.assertRaises(ValueError):
+      asyncio.run(Neo4jConnector(self.xgt, Neo4jDriver.from_Neo4jDriver(
+          driver.bolt)).async_transfer_to_xgt())
+    driver.bolt.close()
+    self.xgt.drop_frame("Relationship")
+    self.xgt.drop_frame("Link")
+
+  def test_transfer_partitioned(self):
+    self._populate_relationship_working_types_bolt()
+    driver = Neo4jDriver(auth=('neo4j', 'foo'))
+    c = Neo4jConnector(self.xgt, driver)
+    c.transfer_to_xgt(partitions=3)
+    assert self.xgt.get_frame('Node').num_rows == 6
+    assert self.xgt.get_frame('Relationship').num_rows == 3
+    c.transfer_to_xgt(partitions={'Node' : 4})
+    assert self.xgt.get_frame('Node').num_rows == 6
+    assert self.xgt.get_frame('Relationship').num_rows == 3
+    with self.assertRaises(ValueError):
+      c.transfer_to_xgt(partitions=0)
+    driver.bolt.close()
+    self.xgt.drop_frame("Relationship")
+
+  def test_schema_snapshot(self):
+    self.neo4j_driver.query(
+        'CREATE (:Node1{x: 1})-[:Relationship1{}]->(:Node2{})').finalize()
+    with tempfile.TemporaryDirectory() as directory:
+      cache = os.path.join(directory, 'schema.json')
+      c = Neo4jConnector(self.xgt, self.neo4j_driver, schema_ttl=None,
+                         schema_cache=cache)
+      self.assertCountEqual(c.neo4j_node_labels, ['Node1', 'Node2'])
+      assert c.neo4j_edges['Relationship1']['endpoints'] == {('Node1', 'Node2')}
+      assert os.path.exists(cache)
+
+      # Adding a label changes the fingerprint.
+      self.neo4j_driver.query('CREATE (:Node3{y: "a"})').finalize()
+      self.assertCountEqual(c.neo4j_node_labels, ['Node1', 'Node2', 'Node3'])
+      assert c.neo4j_nodes['Node3'] == {'y' : 'String'}
+
+      # A new connector starts from the saved snapshot.
+      c2 = Neo4jConnector(self.xgt, self.neo4j_driver, schema_ttl=None,
+                          schema_cache=cache)
+      assert c2.neo4j_edges == c.neo4j_edges
+      c2.transfer_to_xgt(vertices=['Node1'], edges=['Relationship1'])
+      assert self.xgt.get_frame('Node1').num_rows == 1
+      assert self.xgt.get_frame('Relationship1').num_rows == 1
+      self.xgt.drop_frame('Relationship1')
+
+  def test_schema_sample(self):
+    self.neo4j_driver.query(
+        'UNWIND range(1, 10) AS i CREATE (:Node1{x: i})-[:Relationship1{y: "a"}]->(:Node2{})').finalize()
+    c = Neo4jConnector(self.xgt, self.neo4j_driver, schema_sample=4)
+    assert c.neo4j_nodes['Node1'] == {'x' : 'Long'}
+    assert c.neo4j_edges['Relationship1']['endpoints'] == {('Node1', 'Node2')}
+    confidence = c.neo4j_schema_confidence
+    assert confidence['nodes']['Node1']['x'] < 1
+    assert confidence['edges']['Relationship1']['y'] < 1
+    assert 'Node2' not in confidence['nodes']
+    c.transfer_to_xgt(vertices=['Node1', 'Node2'], edges=['Relationship1'])
+    assert self.xgt.get_frame('Relationship1').num_rows == 10
+
+    with self.assertRaises(ValueError):
+      Neo4jConnector(self.xgt, self.neo4j_driver, schema_sample=0)
+
+  def test_transfer_prefetch(self):
+    self._populate_relationship_working_types_bolt()
+    driver = Neo4jDriver(auth=('neo4j', 'foo'), prefetch_batches=2)
+    c = Neo4jConnector(self.xgt, driver)
+    c.transfer_to_xgt()
+    assert self.xgt.get_frame('Node').num_rows == 6
+    assert self.xgt.get_frame('Relationship').num_rows == 3
+    driver.bolt.close()
+    self.xgt.drop_frame("Relationship")
+
+  def test_transfer_paged_resume(self):
+    self._populate_relationship_working_types_bolt()
+    c = self.conn
+    with tempfile.TemporaryDirectory() as directory:
+      checkpoint = os.path.join(directory, 'checkpoint.json')
+      c.transfer_to_xgt(page_size=2, checkpoint=checkpoint)
+      assert self.xgt.get_frame('Node').num_rows == 6
+      assert self.xgt.get_frame('Relationship').num_rows == 3
+      with open(checkpoint) as f:
+        state = json.load(f)
+      assert all(value['done'] for value in state.values())
+
+      # Resuming a completed transfer doesn't copy anything again.
+      c.transfer_to_xgt(checkpoint=checkpoint, resume=True)
+      assert self.xgt.get_frame('Node').num_rows == 6
+      assert self.xgt.get_frame('Relationship').num_rows == 3
+
+      # Resume part way through the nodes.
+      node_ids = sorted(row[0] for row in self.xgt.get_frame('Node').get_data())
+      key = next(key for key in state if key.endswith('__Node'))
+      state[key] = {'last' : node_ids[2], 'done' : False}
+      with open(checkpoint, 'w') as f:
+        json.dump(state, f)
+      self.xgt.drop_frame('Relationship')
+      c.transfer_to_xgt(vertices=['Node'], checkpoint=checkpoint, resume=True)
+      assert self.xgt.get_frame('Node').num_rows == 6
+
+    with self.assertRaises(ValueError):
+      c.transfer_to_xgt(resume=True)
+    with self.assertRaises(ValueError):
+      c.transfer_to_xgt(page_size=0)
+
+  def test_transfer_paged_resume_edges(self):
+    self._populate_relationship_working_types_bolt()
+    c = self.conn
+    set_state = _JSONState.set
+    def interrupt(state, key, value):
+      # Stop after the first edge page is committed, before its checkpoint.
+      if (key.endswith('__Relationship') and 'pending' not in value and
+          not value['done']):
+        raise RuntimeError('interrupted')
+      set_state(state, key, value)
+
+    with tempfile.TemporaryDirectory() as directory:
+      checkpoint = os.path.join(directory, 'checkpoint.json')
+      with mock.patch.object(_JSONState, 'set', interrupt):
+        with self.assertRaises(RuntimeError):
+          c.transfer_to_xgt(page_size=2, checkpoint=checkpoint)
+      assert self.xgt.get_frame('Relationship').num_rows == 2
+
+      # The committed page isn't copied again.
+      c.transfer_to_xgt(page_size=2, checkpoint=checkpoint, resume=True)
+      assert self.xgt.get_frame('Node').num_rows == 6
+      assert self.xgt.get_frame('Relationship').num_rows == 3
+    self.xgt.drop_frame("Relationship")
+
   def test_append(self):
     c = self.conn
     self.neo4j_driver.query(
@@ -456,6 +620,124 @@ class TestXgtNeo4jConnector(unittest.TestCase):
     self.xgt.drop_frame("Node1_Relationship_Node1")
     self.xgt.drop_frame("Node2_Relationship_Node1")
 
+  def test_relationship_label_pairs_single_pass(self):
+    c = Neo4jConnector(self.xgt, Neo4jDriver(auth=('neo4j', 'foo')))
+    self.neo4j_driver.query(
+        'CREATE (:Node1{})-[:Relationship{x: 1}]->(:Node1{}), (:Node1{})-[:Relationship{x: 2}]->(:Node2{}),'
+        '(:Node1:Node2{})-[:Relationship{x: 3}]->(:Node2{})').finalize()
+    schema = c.get_xgt_schemas(vertices=['Node1', 'Node2'], edges=['Relationship'])
+    c.create_xgt_schemas(schema)
+    c.copy_data_to_xgt(schema, single_pass=True)
+
+    node_frame = self.xgt.get_frame('Node1_Relationship_Node1')
+    assert node_frame.num_rows == 1
+    node_frame = self.xgt.get_frame('Node1_Relationship_Node2')
+    assert node_frame.num_rows == 2
+    node_frame = self.xgt.get_frame('Node2_Relationship_Node2')
+    assert node_frame.num_rows == 1
+    for frame in ['Node1_Relationship_Node1', 'Node1_Relationship_Node2', 'Node2_Relationship_Node2']:
+      self.xgt.drop_frame(frame)
+
+    with self.assertRaises(ValueError):
+      c.copy_data_to_xgt(schema, single_pass=True, page_size=10)
+
+  def test_multiple_node_labels_single_pass(self):
+    c = Neo4jConnector(self.xgt, Neo4jDriver(auth=('neo4j', 'foo')))
+    self.neo4j_driver.query(
+        'CREATE (:Node1{x: 1}), (:Node1:Node2{x: 2, y: "a"}), (:Node2{y: "b"})').finalize()
+    schema = c.get_xgt_schemas(vertices=['Node1', 'Node2'])
+    c.create_xgt_schemas(schema)
+    c.copy_data_to_xgt(schema, single_pass=True)
+
+    assert self.xgt.get_frame('Node1').num_rows == 2
+    assert self.xgt.get_frame('Node2').num_rows == 2
+
+  def test_transfer_filtered(self):
+    c = self.conn
+    self.neo4j_driver.query(
+        'CREATE (:Node1{x: 1, y: "a", active: true})-[:Relationship{w: 1, z: 2}]->(:Node2{}),'
+        '(:Node1{x: 2, y: "b", active: false})-[:Relationship{w: 2, z: 3}]->(:Node2{})').finalize()
+    schema = c.get_xgt_schemas(vertices=[('Node1', 'Node1', ['x'], 'v.active')],
+                               edges=[('Relationship', 'Relationship', ['w'], 'u.active AND e.w > 0')])
+    assert [column[0] for column in schema['vertices']['Node1']['schema']] == ['neo4j_id', 'x']
+    assert [column[0] for column in schema['edges']['Relationship'][0]['schema']] == ['neo4j_source', 'neo4j_target', 'w']
+    c.create_xgt_schemas(schema)
+    c.copy_data_to_xgt(schema)
+    assert [row[1:] for row in self.xgt.get_frame('Node1').get_data()] == [[1]]
+    assert [row[2:] for row in self.xgt.get_frame('Relationship').get_data()] == [[1]]
+    self.xgt.drop_frame('Relationship')
+
+    with self.assertRaises(ValueError):
+      c.get_xgt_schemas(vertices=[('Node1', 'Node1', ['missing'])])
+
+  def test_transfer_subgraph(self):
+    c = Neo4jConnector(self.xgt, Neo4jDriver(auth=('neo4j', 'foo')))
+    self.neo4j_driver.query(
+        'CREATE (:Node1{x: 0})-[:Relationship{}]->(:Node1{x: 1})-[:Relationship{}]->(:Node1{x: 2})'
+        '-[:Relationship{}]->(:Node1{x: 3}), (:Node1{x: 4})').finalize()
+    c.transfer_subgraph_to_xgt('MATCH (v:Node1{x: 1}) RETURN id(v)', hops=1)
+    self.assertCountEqual([row[1] for row in self.xgt.get_frame('Node1').get_data()], [0, 1, 2])
+    assert self.xgt.get_frame('Relationship').num_rows == 2
+    self.xgt.drop_frame('Relationship')
+
+    c.transfer_subgraph_to_xgt('MATCH (v:Node1{x: 0}) RETURN id(v)', hops=3,
+                               rel_types=['Relationship'])
+    assert self.xgt.get_frame('Node1').num_rows == 4
+    assert self.xgt.get_frame('Relationship').num_rows == 3
+    self.xgt.drop_frame('Relationship')
+
+  def test_transfer_incremental(self):
+    c = Neo4jConnector(self.xgt, Neo4jDriver(auth=('neo4j', 'foo')))
+    self.neo4j_driver.query(
+        'CREATE (:Node1{x: 1, updated_at: 1})-[:Relationship{updated_at: 1}]->(:Node1{x: 2, updated_at: 2})').finalize()
+    with tempfile.TemporaryDirectory() as directory:
+      state = os.path.join(directory, 'watermarks.json')
+      with self.assertRaises(ValueError):
+        c.transfer_to_xgt(vertices=['Node1'], edges=['Relationship'],
+                          watermark='updated_at', watermark_state=state)
+      c.transfer_to_xgt(vertices=['Node1'], edges=['Relationship'],
+                        watermark='updated_at', watermark_state=state,
+                        watermark_insert_only=True)
+      assert self.xgt.get_frame('Node1').num_rows == 2
+      assert self.xgt.get_frame('Relationship').num_rows == 1
+      with open(state) as f:
+        assert [value['value'] for value in json.load(f).values()] == [2, 1]
+
+      # Only the new node and relationship and the changed node are copied.
+      self.neo4j_driver.query(
+          'MATCH (a:Node1{x: 2}) CREATE (a)-[:Relationship{updated_at: 3}]->(:Node1{x: 3, updated_at: 3})').finalize()
+      self.neo4j_driver.query(
+          'MATCH (a:Node1{x: 1}) SET a.x = 4, a.updated_at = 4').finalize()
+      c.transfer_to_xgt(vertices=['Node1'], edges=['Relationship'],
+                        watermark='updated_at', watermark_state=state,
+                        watermark_insert_only=True)
+      assert self.xgt.get_frame('Node1').num_rows == 3
+      assert self.xgt.get_frame('Relationship').num_rows == 2
+      res = self.xgt.run_job('MATCH (v:Node1) RETURN v.x ORDER BY v.x').get_data()
+      assert res == [[2], [3], [4]]
+
+      with self.assertRaises(ValueError):
+        c.transfer_to_xgt(vertices=['Node1'], watermark='updated_at')
+    self.xgt.drop_frame('Relationship')
+
+  def test_transfer_explain(self):
+    c = self.conn
+    self.neo4j_driver.query(
+        'CREATE (:Node1{})-[:Relationship{}]->(:Node2{}), (:Node1{})-[:Relationship{}]->(:Node2{})').finalize()
+    report = c.transfer_to_xgt(vertices=['Node1', 'Node2'], edges=['Relationship'], explain=True)
+    self.assertCountEqual([entry['frame'] for entry in report], ['Node1', 'Node2', 'Relationship'])
+    edge = [entry for entry in report if entry['frame'] == 'Relationship'][0]
+    # A type with one pair of endpoint labels doesn't check the labels.
+    assert edge['query'].startswith('MATCH (u)-[e:Relationship]->(v) ')
+    assert edge['estimated_rows'] is not None
+    assert edge['db_hits'] is None
+    assert self.xgt.get_frame('Relationship').num_rows == 2
+    self.xgt.drop_frame('Relationship')
+
+    report = c.transfer_to_xgt(vertices=['Node1'], explain='profile')
+    assert report[0]['rows'] == 2
+    assert report[0]['db_hits'] > 0
+
   def test_multiple_property_types_vertex_negative(self):
     c = self.conn
     self.neo4j_driver.query(
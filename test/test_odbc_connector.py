@@ -487,6 +487,53 @@ class TestXgtODBCConnector(unittest.TestCase):
     assert self.xgt.get_frame('test').num_rows == 1
     self.assert_list_equal(self.xgt.get_frame('test').get_data(), result)
 
+  def test_transfer_to_odbc_upsert(self):
+    cursor = self.odbc_driver.cursor()
+    cursor.execute("CREATE TABLE test (Value1 INT PRIMARY KEY, Value2 varchar(255))")
+    cursor.execute("INSERT INTO test VALUES (0, 'hola')")
+    cursor.execute("INSERT INTO test VALUES (1, 'adios')")
+    self.odbc_driver.commit()
+
+    self.conn.transfer_to_xgt(tables = [('test', (0,))])
+    cursor.execute("UPDATE test SET Value2 = 'old' WHERE Value1 = 0")
+    cursor.execute("DELETE FROM test WHERE Value1 = 1")
+    cursor.execute("INSERT INTO test VALUES (2, 'hello')")
+    self.odbc_driver.commit()
+
+    self.conn.transfer_to_odbc(vertices = ['test'], upsert = True)
+    cursor.execute("SELECT * FROM test ORDER BY Value1")
+    assert [list(row) for row in cursor.fetchall()] == [[0, 'hola'], [1, 'adios'], [2, 'hello']]
+
+    # Running again doesn't duplicate rows.
+    self.conn.transfer_to_odbc(vertices = ['test'], upsert = True)
+    cursor.execute("SELECT COUNT(*) FROM test")
+    assert cursor.fetchone()[0] == 3
+
+    with self.assertRaises(ValueError):
+      self.conn.transfer_to_odbc(tables = ['test'], upsert = True)
+
+  def test_transfer_to_odbc_create_tables(self):
+    cursor = self.odbc_driver.cursor()
+    cursor.execute("CREATE TABLE test (Value1 INT, Value2 varchar(255), Value3 INT)")
+    cursor.execute("INSERT INTO test VALUES (0, 'hola', 1), (1, 'adios', 0)")
+    self.odbc_driver.commit()
+
+    self.conn.transfer_to_xgt(tables = [('test', 'Node', (1,))])
+    self.conn.transfer_to_xgt(tables = [('test', 'Relationship', ('Node', 'Node', 1, 1))])
+    cursor.execute("DROP TABLE test")
+    self.odbc_driver.commit()
+
+    self.conn.transfer_to_odbc(vertices = ['Node'], edges = ['Relationship'], create_tables = True)
+    cursor.execute("SELECT * FROM Node ORDER BY Value1")
+    assert [list(row) for row in cursor.fetchall()] == [[0, 'hola', 1], [1, 'adios', 0]]
+    cursor.execute("SELECT COUNT(*) FROM Relationship")
+    assert cursor.fetchone()[0] == 2
+    cursor.execute("SHOW KEYS FROM Node WHERE Key_name = 'PRIMARY'")
+    assert [row[4] for row in cursor.fetchall()] == ['Value2']
+
+    with self.assertRaises(ValueError):
+      self.conn.transfer_to_odbc(vertices = ['Node'], create_tables = True, upsert = True)
+
   def test_transfer_query(self):
     result = [[1, 32, 5000, 1.7, 1.98, 'vdxs', 'String', 1.78976, date(year = 1989, month = 5, day = 6),
                datetime(year = 1986, month = 5, day = 6, hour = 12, minute = 56, second = 34),
@@ -505,6 +552,37 @@ class TestXgtODBCConnector(unittest.TestCase):
     assert self.xgt.get_frame('my_test').num_rows == 2
     self.assert_list_equal(self.xgt.get_frame('my_test').get_data(), result)
 
+  def test_transfer_query_aggregate(self):
+    cursor = self.odbc_driver.cursor()
+    cursor.execute("CREATE TABLE test (Value1 INT, Value2 INT, Value3 varchar(255))")
+    cursor.execute("INSERT INTO test VALUES (0, 0, 'hola'), (1, 0, 'adios'), (2, 1, 'hola')")
+    self.odbc_driver.commit()
+
+    # The query's schema is described without running it.
+    self.conn.transfer_query_to_xgt("SELECT Value3, COUNT(*) AS Total FROM test GROUP BY Value3;",
+                                    mapping = ('my_test', (0,)))
+    self.assertCountEqual(self.xgt.get_frame('my_test').get_data(), [['hola', 2], ['adios', 1]])
+
+  def test_transfer_query_fan_out(self):
+    cursor = self.odbc_driver.cursor()
+    cursor.execute("CREATE TABLE test (Person INT, Name varchar(255), Company INT, Since INT)")
+    cursor.execute("INSERT INTO test VALUES (0, 'Ana', 10, 1999), (1, 'Bo', 10, 2001), (0, 'Ana', 11, 2010)")
+    self.odbc_driver.commit()
+
+    row_count, _ = self.conn.transfer_query_to_xgt("SELECT * FROM test", mapping = [
+        ('Person', {'frame' : 'Person', 'key' : 'Person', 'columns' : ['Person', 'Name']}),
+        ('Company', {'frame' : 'Company', 'key' : 0, 'columns' : [2]}),
+        ('WorksAt', {'frame' : 'WorksAt', 'source' : 'Person', 'target' : 'Company',
+                     'source_key' : 'Person', 'target_key' : 'Company', 'columns' : [0, 2, 3]})])
+    assert row_count == 3
+    self.assertCountEqual(self.xgt.get_frame('Person').get_data(), [[0, 'Ana'], [1, 'Bo']])
+    self.assertCountEqual(self.xgt.get_frame('Company').get_data(), [[10], [11]])
+    self.assertCountEqual(self.xgt.get_frame('WorksAt').get_data(), [[0, 10, 1999], [1, 10, 2001], [0, 11, 2010]])
+
+    with self.assertRaises(ValueError):
+      self.conn.transfer_query_to_xgt("SELECT * FROM test", mapping = [
+          ('Person', {'frame' : 'Person', 'key' : 'Person', 'columns' : ['Missing']})])
+
   def test_vertex_query(self):
     result = [[0, 0, 'hola'], [1, 0, 'adios']]
     cursor = self.odbc_driver.cursor()